@@ -4,19 +4,22 @@ This example demonstrates how to use the ResearchAgent for simple searches.
 """
 
 import os
-from dotenv import load_dotenv
 
 from lonai import ResearchAgent
+from lonai._cli_utils import safe_main
+from lonai._env import ensure_env_loaded
 from lonai.config import get_settings
 
 # Load environment variables from .env file
-load_dotenv()
+ensure_env_loaded()
+
+BANNER = "=" * 60
 
 def main():
     """Run a basic search example."""
-    print("=" * 60)
+    print(BANNER)
     print("Research Assistant - Basic Search Example")
-    print("=" * 60)
+    print(BANNER)
     print()
     
     # Initialize the research agent
@@ -36,9 +39,9 @@ def main():
     )
     
     # Display results
-    print("\n" + "=" * 60)
+    print("\n" + BANNER)
     print("RESEARCH RESULTS")
-    print("=" * 60)
+    print(BANNER)
     print()
     print(result['response'])
     print()
@@ -47,12 +50,7 @@ def main():
         print(f"✓ Results saved to: {result['saved_path']}")
     
     print()
-    print("=" * 60)
+    print(BANNER)
 
 if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print("\n\nResearch interrupted by user.")
-    except Exception as e:
-        print(f"\n\nError: {e}")
+    safe_main(main)()
@@ -9,7 +9,25 @@ __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-from lonai.core.agent import ResearchAgent
-from lonai.config.settings import Settings
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lonai.config.settings import Settings
+    from lonai.core.agent import ResearchAgent
 
 __all__ = ["ResearchAgent", "Settings"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy public attributes on first access (PEP 562).
+    
+    Importing ``lonai`` (e.g. for ``lonai --help``) should not pull in the
+    agent framework and LLM SDKs until they are actually used.
+    """
+    if name == "ResearchAgent":
+        from lonai.core.agent import ResearchAgent
+        return ResearchAgent
+    if name == "Settings":
+        from lonai.config.settings import Settings
+        return Settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
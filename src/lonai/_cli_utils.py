@@ -0,0 +1,29 @@
+"""Shared helpers for command-line entry points and example scripts."""
+
+import functools
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def safe_main(fn: Callable[[], T]) -> Callable[[], Optional[T]]:
+    """Wrap a script's ``main`` with the standard interrupt/error handling.
+    
+    Args:
+        fn: Entry point taking no arguments
+        
+    Returns:
+        Wrapped entry point that reports interrupts and errors instead of
+        printing a traceback
+    """
+    @functools.wraps(fn)
+    def wrapper() -> Optional[T]:
+        try:
+            return fn()
+        except KeyboardInterrupt:
+            print("\n\nResearch interrupted by user.")
+        except Exception as e:
+            print(f"\n\nError: {e}")
+        return None
+    
+    return wrapper
@@ -0,0 +1,17 @@
+"""One-time loading of environment variables from a .env file."""
+
+_loaded = False
+
+
+def ensure_env_loaded() -> None:
+    """Load variables from the nearest .env file, at most once per process.
+    
+    ``load_dotenv`` walks up the directory tree looking for ``.env``; entry
+    points call this instead so repeated imports don't repeat the search.
+    """
+    global _loaded
+    if _loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _loaded = True
@@ -0,0 +1,27 @@
+"""Lazy YAML loading shared by the settings and logging configuration."""
+
+from functools import lru_cache
+from typing import IO, Any, Union
+
+
+@lru_cache(maxsize=1)
+def _loader() -> Any:
+    """Import PyYAML on first use and prefer the libyaml-backed loader."""
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # pragma: no cover - depends on how PyYAML was built
+        from yaml import SafeLoader as loader
+    return loader
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document with the fastest available safe loader.
+    
+    Args:
+        stream: YAML text or an open file
+        
+    Returns:
+        Parsed data
+    """
+    import yaml
+    return yaml.load(stream, Loader=_loader())
@@ -1,27 +1,28 @@
 """CLI commands using Click framework."""
 
+import asyncio
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
 
 import click
-from dotenv import load_dotenv
 
-from lonai import ResearchAgent
+from lonai._env import ensure_env_loaded
 from lonai.cli.formatters import OutputFormatter
 from lonai.config import get_settings
-from lonai.config.constants import ExportFormat
+from lonai.config.constants import LOGS_DIR, ExportFormat, from_value
 from lonai.utils.logging import setup_logging
-from lonai.utils.validators import validate_api_keys, validate_query
+from lonai.utils.validators import contains_cjk, validate_api_keys, validate_query
+
+if TYPE_CHECKING:
+    from lonai.core.agent import ResearchAgent
 
 # Load environment variables
-load_dotenv()
+ensure_env_loaded()
 
 # Setup logging
 setup_logging()
 
-formatter = OutputFormatter()
-
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="Research Assistant")
@@ -35,7 +36,9 @@ def cli() -> None:
 
 @cli.command()
 @click.argument("query", required=False)
-@click.option("--lang", "-l", default="en", type=click.Choice(["en", "zh"]), help="Language (en/zh)")
+@click.option(
+    "--lang", "-l", default="en", type=click.Choice(["en", "zh"]), help="Language (en/zh)"
+)
 @click.option("--save/--no-save", default=True, help="Save results to storage")
 @click.option("--export", "-e", is_flag=True, help="Export formatted report")
 @click.option(
@@ -45,12 +48,16 @@ def cli() -> None:
     default="markdown",
     help="Export format"
 )
+@click.option("--cache/--no-cache", default=True, help="Use cached results when available")
+@click.option("--refresh-cache", is_flag=True, help="Ignore cached results and refresh the cache")
 def research(
     query: Optional[str],
     lang: str,
     save: bool,
     export: bool,
-    format: str
+    format: str,
+    cache: bool,
+    refresh_cache: bool
 ) -> None:
     """Conduct research on a topic.
     
@@ -65,69 +72,173 @@ def research(
     # Validate API keys
     valid, error = validate_api_keys()
     if not valid:
-        formatter.print_error(error)
+        OutputFormatter.print_error(error)
         sys.exit(1)
     
     # Get query from user if not provided
     if not query:
-        query = formatter.prompt("Enter your research question:")
+        query = OutputFormatter.prompt("Enter your research question:")
     
     # Validate query
     valid, error = validate_query(query)
     if not valid:
-        formatter.print_error(f"Invalid query: {error}")
+        OutputFormatter.print_error(f"Invalid query: {error}")
         sys.exit(1)
     
     try:
         # Initialize agent
-        formatter.print_header("Research Assistant")
-        formatter.print_info(f"Query: {query}")
+        OutputFormatter.print_header("Research Assistant")
+        OutputFormatter.print_info(f"Query: {query}")
         
         # Auto-detect Chinese if not explicitly set
-        if lang == "en" and any('\u4e00' <= char <= '\u9fff' for char in query):
+        if lang == "en" and contains_cjk(query):
             lang = "zh"
-            formatter.print_info("Auto-detected language: zh (Chinese)")
+            OutputFormatter.print_info("Auto-detected language: zh (Chinese)")
         
-        formatter.print_info(f"Language: {lang}")
+        OutputFormatter.print_info(f"Language: {lang}")
         
-        with formatter.create_progress() as progress:
+        with OutputFormatter.create_progress() as progress:
             task = progress.add_task("Initializing agent...", total=None)
             
+            from lonai.core.agent import ResearchAgent
+            
             agent = ResearchAgent(language=lang)
             
             progress.update(task, description="Conducting research...")
             
             # Convert export format string to enum
-            export_format = ExportFormat(format) if export else None
-            
-            # Update settings if exporting
-            if export:
-                agent.settings.export_default_format = export_format
+            export_format = from_value(ExportFormat, format) if export else None
             
             result = agent.research(
                 query=query,
                 save_results=save,
-                export_report=export
+                export_report=export,
+                export_format=export_format,
+                use_cache=cache,
+                refresh_cache=refresh_cache
             )
             
             progress.update(task, description="Complete!", completed=True)
         
         # Display result
-        formatter.print_result(result)
+        OutputFormatter.print_result(result)
         
     except KeyboardInterrupt:
-        formatter.print_warning("\nResearch interrupted by user.")
+        OutputFormatter.print_warning("\nResearch interrupted by user.")
         sys.exit(130)
     except Exception as e:
-        formatter.print_error(f"Research failed: {e}")
+        OutputFormatter.print_error(f"Research failed: {e}")
         sys.exit(1)
 
 
+def _iter_queries(path: str) -> Iterator[str]:
+    """Lazily yield non-empty, stripped queries from a file, one per line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            query = line.strip()
+            if query:
+                yield query
+
+
+# ASCII whitespace str.strip() removes, minus the line separators (this
+# includes \x1c-\x1f, which bytes.strip() keeps)
+_ASCII_BLANKS = bytes(c for c in range(128) if chr(c).isspace() and c not in (10, 13))
+_CR_TO_LF = bytes.maketrans(b'\r', b'\n')
+
+
+def _count_lines(data: bytes) -> int:
+    """Count the non-empty lines of text whose only whitespace is ``\\n``."""
+    while b'\n\n' in data:
+        data = data.replace(b'\n\n', b'\n')
+    if not data:
+        return 0
+    return data.count(b'\n') + (not data.endswith(b'\n')) - data.startswith(b'\n')
+
+
+def _count_queries(path: str, block_size: int = 1 << 20) -> int:
+    """Count the queries _iter_queries() will yield, with a binary pass.
+    
+    ASCII blocks are counted with bytes operations only; blocks holding
+    other characters are decoded, so lines with only Unicode whitespace
+    (e.g. NBSP) are skipped exactly as _iter_queries() skips them. ``\\r``
+    is treated as a line separator, like text-mode universal newlines.
+    """
+    count = 0
+    rest = b''
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            data = rest + block
+            if block:
+                # Only count whole lines; carry the partial last line over
+                cut = data.rfind(b'\n') + 1
+                data, rest = data[:cut], data[cut:]
+            if data.isascii():
+                count += _count_lines(data.translate(_CR_TO_LF, _ASCII_BLANKS))
+            else:
+                text = data.decode('utf-8').replace('\r', '\n')
+                count += sum(1 for line in text.split('\n') if line.strip())
+            if not block:
+                return count
+
+
+async def _research_one(agent: "ResearchAgent", query: str, **kwargs: Any) -> Dict[str, Any]:
+    """Run a single research call in a worker thread."""
+    try:
+        return await asyncio.to_thread(agent.research, query=query, **kwargs)
+    except Exception as e:
+        return {"query": query, "error": str(e)}
+
+
+async def _run_batch(
+    agent: "ResearchAgent",
+    queries: Iterable[str],
+    concurrency: int,
+    on_done: Callable[[Dict[str, Any]], None],
+    **kwargs: Any
+) -> List[Dict[str, Any]]:
+    """Research queries concurrently, preserving input order in the results.
+    
+    Queries are pulled from the iterable only as worker slots free up, so at
+    most ``concurrency`` queries are in flight at any time.
+    """
+    def report(task: "asyncio.Task[Dict[str, Any]]") -> None:
+        # Tasks cancelled on interrupt have no result to report
+        if not task.cancelled():
+            on_done(task.result())
+    
+    tasks: List["asyncio.Task[Dict[str, Any]]"] = []
+    pending: Set["asyncio.Task[Dict[str, Any]]"] = set()
+    for query in queries:
+        if len(pending) >= concurrency:
+            _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        task = asyncio.ensure_future(_research_one(agent, query, **kwargs))
+        task.add_done_callback(report)
+        tasks.append(task)
+        pending.add(task)
+    return await asyncio.gather(*tasks)
+
+
 @cli.command()
 @click.argument("file", type=click.Path(exists=True))
 @click.option("--lang", "-l", default="en", type=click.Choice(["en", "zh"]), help="Language")
 @click.option("--save/--no-save", default=True, help="Save results")
-def batch(file: str, lang: str, save: bool) -> None:
+@click.option(
+    "--concurrency",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Number of queries to research concurrently [default: settings.batch_concurrency]"
+)
+@click.option("--cache/--no-cache", default=True, help="Use cached results when available")
+@click.option("--refresh-cache", is_flag=True, help="Ignore cached results and refresh the cache")
+def batch(
+    file: str,
+    lang: str,
+    save: bool,
+    concurrency: Optional[int],
+    cache: bool,
+    refresh_cache: bool
+) -> None:
     """Conduct research on multiple topics from a file.
     
     The file should contain one query per line.
@@ -135,58 +246,76 @@ def batch(file: str, lang: str, save: bool) -> None:
     Example:
     
         research batch queries.txt
+        
+        research batch queries.txt --concurrency 8
     """
     # Validate API keys
     valid, error = validate_api_keys()
     if not valid:
-        formatter.print_error(error)
+        OutputFormatter.print_error(error)
         sys.exit(1)
     
-    # Read queries from file
+    # Count queries up front; the queries themselves are streamed lazily
     try:
-        with open(file, 'r', encoding='utf-8') as f:
-            queries = [line.strip() for line in f if line.strip()]
+        total = _count_queries(file)
     except Exception as e:
-        formatter.print_error(f"Failed to read file: {e}")
+        OutputFormatter.print_error(f"Failed to read file: {e}")
         sys.exit(1)
     
-    if not queries:
-        formatter.print_warning("No queries found in file.")
+    if not total:
+        OutputFormatter.print_warning("No queries found in file.")
         sys.exit(0)
     
-    formatter.print_header("Batch Research")
-    formatter.print_info(f"Processing {len(queries)} queries from {file}")
+    OutputFormatter.print_header("Batch Research")
+    OutputFormatter.print_info(f"Processing {total} queries from {file}")
     
     try:
+        from lonai.core.agent import ResearchAgent
+        
+        # A single agent is shared by all workers; research calls only read from it
         agent = ResearchAgent(language=lang)
         
-        with formatter.create_progress() as progress:
-            task = progress.add_task(f"Processing {len(queries)} queries...", total=len(queries))
+        with OutputFormatter.create_progress() as progress:
+            task = progress.add_task(f"Processing {total} queries...", total=total)
+            completed = 0
             
-            results = []
-            for i, query in enumerate(queries, 1):
-                progress.update(task, description=f"[{i}/{len(queries)}] {query[:50]}...")
-                
-                result = agent.research(query=query, save_results=save, export_report=False)
-                results.append(result)
-                
-                progress.advance(task)
+            def on_done(result: Dict[str, Any]) -> None:
+                nonlocal completed
+                completed += 1
+                progress.update(
+                    task,
+                    description=f"[{completed}/{total}] {result['query'][:50]}...",
+                    advance=1
+                )
+            
+            results = asyncio.run(
+                _run_batch(
+                    agent,
+                    _iter_queries(file),
+                    concurrency or agent.settings.batch_concurrency,
+                    on_done,
+                    save_results=save,
+                    export_report=False,
+                    use_cache=cache,
+                    refresh_cache=refresh_cache
+                )
+            )
         
         # Summary
-        formatter.print_success(f"\nCompleted {len(results)} research tasks.")
+        OutputFormatter.print_success(f"\nCompleted {len(results)} research tasks.")
         
         # Show brief results
         for i, result in enumerate(results, 1):
             if "error" in result:
-                formatter.print_error(f"{i}. {result['query']}: {result['error']}")
+                OutputFormatter.print_error(f"{i}. {result['query']}: {result['error']}")
             else:
-                formatter.print_success(f"{i}. {result['query']}")
+                OutputFormatter.print_success(f"{i}. {result['query']}")
         
     except KeyboardInterrupt:
-        formatter.print_warning("\nBatch research interrupted by user.")
+        OutputFormatter.print_warning("\nBatch research interrupted by user.")
         sys.exit(130)
     except Exception as e:
-        formatter.print_error(f"Batch research failed: {e}")
+        OutputFormatter.print_error(f"Batch research failed: {e}")
         sys.exit(1)
 
 
@@ -205,23 +334,44 @@ def history(limit: int, search: Optional[str]) -> None:
         research history --search "quantum"
     """
     try:
+        from lonai.core.agent import ResearchAgent
+        
         settings = get_settings()
         agent = ResearchAgent(settings=settings)
         
         if search:
-            formatter.print_header(f"Search Results: '{search}'")
+            OutputFormatter.print_header(f"Search Results: '{search}'")
             records = agent.search_history(search)
         else:
-            formatter.print_header("Research History")
+            OutputFormatter.print_header("Research History")
             records = agent.get_history(limit=limit)
         
-        formatter.print_history(records)
+        OutputFormatter.print_history(records)
         
     except Exception as e:
-        formatter.print_error(f"Failed to retrieve history: {e}")
+        OutputFormatter.print_error(f"Failed to retrieve history: {e}")
         sys.exit(1)
 
 
+def _chat_prompt() -> Callable[[str], str]:
+    """Build the chat input function.
+    
+    Uses prompt_toolkit (line editing and persistent history) when it is
+    installed, otherwise falls back to the Rich console prompt.
+    """
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import FileHistory
+    except ImportError:
+        return OutputFormatter.prompt
+    
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    session: "PromptSession[str]" = PromptSession(
+        history=FileHistory(str(LOGS_DIR / "chat_history"))
+    )
+    return lambda message: session.prompt(f"{message} › ")
+
+
 @cli.command()
 @click.option("--interactive", "-i", is_flag=True, help="Interactive mode")
 def chat(interactive: bool) -> None:
@@ -234,58 +384,66 @@ def chat(interactive: bool) -> None:
     # Validate API keys
     valid, error = validate_api_keys()
     if not valid:
-        formatter.print_error(error)
+        OutputFormatter.print_error(error)
         sys.exit(1)
     
-    formatter.print_header("Interactive Research Chat")
-    formatter.print_info("Type 'exit' or 'quit' to end the session.")
-    formatter.print_info("Type 'help' for available commands.")
+    OutputFormatter.print_header("Interactive Research Chat")
+    OutputFormatter.print_info("Type 'exit' or 'quit' to end the session.")
+    OutputFormatter.print_info("Type 'help' for available commands.")
     
     try:
+        from lonai.core.agent import ResearchAgent
+        
         agent = ResearchAgent()
+        prompt = _chat_prompt()
         
         while True:
             try:
-                query = formatter.prompt("\nYour question")
+                query = prompt("\nYour question")
                 
                 if not query:
                     continue
                 
                 if query.lower() in ["exit", "quit", "q"]:
-                    formatter.print_success("Goodbye!")
+                    OutputFormatter.print_success("Goodbye!")
                     break
                 
                 if query.lower() == "help":
-                    formatter.print_info("Commands:")
-                    formatter.print_info("  - Type any question to research")
-                    formatter.print_info("  - 'exit', 'quit', 'q' to exit")
-                    formatter.print_info("  - 'help' to show this message")
+                    OutputFormatter.print_info("Commands:")
+                    OutputFormatter.print_info("  - Type any question to research")
+                    OutputFormatter.print_info("  - 'exit', 'quit', 'q' to exit")
+                    OutputFormatter.print_info("  - 'help' to show this message")
                     continue
                 
                 # Validate query
                 valid, error = validate_query(query)
                 if not valid:
-                    formatter.print_warning(f"Invalid query: {error}")
+                    OutputFormatter.print_warning(f"Invalid query: {error}")
                     continue
                 
                 # Conduct research
-                with formatter.create_progress() as progress:
+                with OutputFormatter.create_progress() as progress:
                     task = progress.add_task("Researching...", total=None)
                     result = agent.research(query=query, save_results=True, export_report=False)
                     progress.update(task, description="Complete!", completed=True)
                 
                 # Display response
-                formatter.print_markdown(result['response'], title="Research Result")
+                OutputFormatter.print_markdown(result['response'], title="Research Result")
                 
             except KeyboardInterrupt:
-                formatter.print_warning("\nUse 'exit' to quit.")
+                OutputFormatter.print_warning("\nUse 'exit' to quit.")
                 continue
     
     except Exception as e:
-        formatter.print_error(f"Chat session failed: {e}")
+        OutputFormatter.print_error(f"Chat session failed: {e}")
         sys.exit(1)
 
 
+def _mask_key(key: Optional[str]) -> str:
+    """Mask an API key, keeping only its last four characters."""
+    return "***" + key[-4:] if key else "Not set"
+
+
 @cli.command()
 def config() -> None:
     """Show current configuration.
@@ -295,7 +453,7 @@ def config() -> None:
     try:
         settings = get_settings()
         
-        formatter.print_header("Current Configuration")
+        OutputFormatter.print_header("Current Configuration")
         
         # Create config display (hide API keys)
         config_data = {
@@ -311,18 +469,17 @@ def config() -> None:
             "Export Format": settings.export_default_format.value,
             "Export Directory": str(settings.export_output_dir),
             "Log Level": settings.log_level,
-            "Generic Agent Key": "***" + settings.agent_api_key[-4:] if settings.agent_api_key else "Not set",
-            "Anthropic API Key": "***" + settings.anthropic_api_key[-4:] if settings.anthropic_api_key else "Not set",
-            "OpenAI API Key": "***" + settings.openai_api_key[-4:] if settings.openai_api_key else "Not set",
-            "Google API Key": "***" + settings.google_api_key[-4:] if settings.google_api_key else "Not set",
-            "Tavily API Key": "***" + settings.tavily_api_key[-4:] if settings.tavily_api_key else "Not set",
+            "Generic Agent Key": _mask_key(settings.agent_api_key),
+            "Anthropic API Key": _mask_key(settings.anthropic_api_key),
+            "OpenAI API Key": _mask_key(settings.openai_api_key),
+            "Google API Key": _mask_key(settings.google_api_key),
+            "Tavily API Key": _mask_key(settings.tavily_api_key),
         }
         
-        for key, value in config_data.items():
-            formatter.print_info(f"{key}: {value}")
+        OutputFormatter.print_key_values(config_data)
         
     except Exception as e:
-        formatter.print_error(f"Failed to load configuration: {e}")
+        OutputFormatter.print_error(f"Failed to load configuration: {e}")
         sys.exit(1)
 
 
@@ -1,6 +1,7 @@
 """Output formatters for CLI."""
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from rich.console import Console
 from rich.markdown import Markdown
@@ -9,7 +10,18 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from rich.text import Text
 
-console = Console()
+if TYPE_CHECKING:
+    from lonai.tools.storage import HistoryBatch
+
+
+@lru_cache(maxsize=1)
+def _console() -> Console:
+    """Get the shared console, created on first use."""
+    return Console()
+
+
+# Queries longer than this are truncated in history tables
+_QUERY_PREVIEW_LENGTH = 60
 
 
 class OutputFormatter:
@@ -22,6 +34,7 @@ class OutputFormatter:
         Args:
             title: Header title
         """
+        console = _console()
         console.print()
         console.print(f"[bold cyan]{title}[/bold cyan]")
         console.print("=" * len(title))
@@ -34,7 +47,7 @@ class OutputFormatter:
         Args:
             message: Success message
         """
-        console.print(f"[green]✓[/green] {message}")
+        _console().print(f"[green]✓[/green] {message}")
     
     @staticmethod
     def print_error(message: str) -> None:
@@ -43,7 +56,7 @@ class OutputFormatter:
         Args:
             message: Error message
         """
-        console.print(f"[red]✗[/red] {message}", style="red")
+        _console().print(f"[red]✗[/red] {message}", style="red")
     
     @staticmethod
     def print_warning(message: str) -> None:
@@ -52,7 +65,7 @@ class OutputFormatter:
         Args:
             message: Warning message
         """
-        console.print(f"[yellow]⚠[/yellow] {message}", style="yellow")
+        _console().print(f"[yellow]⚠[/yellow] {message}", style="yellow")
     
     @staticmethod
     def print_info(message: str) -> None:
@@ -61,7 +74,7 @@ class OutputFormatter:
         Args:
             message: Info message
         """
-        console.print(f"[blue]ℹ[/blue] {message}")
+        _console().print(f"[blue]ℹ[/blue] {message}")
     
     @staticmethod
     def print_markdown(content: str, title: Optional[str] = None) -> None:
@@ -74,9 +87,9 @@ class OutputFormatter:
         md = Markdown(content)
         if title:
             panel = Panel(md, title=title, border_style="cyan")
-            console.print(panel)
+            _console().print(panel)
         else:
-            console.print(md)
+            _console().print(md)
     
     @staticmethod
     def print_result(result: Dict[str, Any]) -> None:
@@ -85,6 +98,7 @@ class OutputFormatter:
         Args:
             result: Result dictionary
         """
+        console = _console()
         console.print()
         console.print(Panel(
             f"[bold]Query:[/bold] {result.get('query', 'N/A')}",
@@ -107,11 +121,11 @@ class OutputFormatter:
         console.print()
     
     @staticmethod
-    def print_history(history: List[Dict[str, Any]]) -> None:
+    def print_history(history: "HistoryBatch") -> None:
         """Print research history as a table.
         
         Args:
-            history: List of history records
+            history: History records as parallel columns
         """
         if not history:
             OutputFormatter.print_warning("No research history found.")
@@ -123,15 +137,29 @@ class OutputFormatter:
         table.add_column("Timestamp", style="magenta")
         table.add_column("Filename", style="green")
         
-        for i, record in enumerate(history, 1):
-            table.add_row(
-                str(i),
-                record.get('query', 'N/A')[:60] + "..." if len(record.get('query', '')) > 60 else record.get('query', 'N/A'),
-                record.get('timestamp', 'N/A'),
-                record.get('filename', 'N/A')
-            )
+        rows = zip(history.queries, history.timestamps, history.filenames)
+        for i, (query, timestamp, filename) in enumerate(rows, 1):
+            if len(query) > _QUERY_PREVIEW_LENGTH:
+                query = query[:_QUERY_PREVIEW_LENGTH] + "..."
+            table.add_row(str(i), query, timestamp, filename)
+        
+        _console().print(table)
+    
+    @staticmethod
+    def print_key_values(data: Dict[str, Any]) -> None:
+        """Print key/value pairs as a borderless two-column table.
+        
+        Args:
+            data: Mapping of labels to values
+        """
+        table = Table(show_header=False, box=None)
+        table.add_column("Key", style="blue")
+        table.add_column("Value")
+        
+        for key, value in data.items():
+            table.add_row(key, str(value))
         
-        console.print(table)
+        _console().print(table)
     
     @staticmethod
     def create_progress() -> Progress:
@@ -143,7 +171,7 @@ class OutputFormatter:
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=_console(),
         )
     
     @staticmethod
@@ -156,4 +184,4 @@ class OutputFormatter:
         Returns:
             User input string
         """
-        return console.input(f"[cyan]{message}[/cyan] ")
+        return _console().input(f"[cyan]{message}[/cyan] ")
@@ -2,6 +2,9 @@
 
 from enum import Enum
 from pathlib import Path
+from typing import Dict, Type, TypeVar, cast
+
+E = TypeVar("E", bound=Enum)
 
 
 class SearchTopic(str, Enum):
@@ -36,6 +39,32 @@ class AgentProvider(str, Enum):
     CUSTOM = "custom"
 
 
+# Precomputed value -> member lookups, avoiding Enum.__call__ dispatch
+_VALUE_MAPS: Dict[type, Dict[str, Enum]] = {
+    enum_cls: {member.value: member for member in enum_cls}
+    for enum_cls in (SearchTopic, ExportFormat, StorageBackend, AgentProvider)
+}
+
+
+def from_value(enum_cls: Type[E], value: str) -> E:
+    """Look up an enum member by its string value.
+    
+    Args:
+        enum_cls: One of the enums defined in this module
+        value: Member value (e.g. "html")
+        
+    Returns:
+        The matching enum member
+        
+    Raises:
+        ValueError: If the value does not belong to the enum
+    """
+    try:
+        return cast(E, _VALUE_MAPS[enum_cls][value])
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}") from None
+
+
 # Default values
 DEFAULT_MAX_RESULTS = 5
 DEFAULT_SEARCH_TOPIC = SearchTopic.GENERAL
@@ -43,14 +72,12 @@ DEFAULT_TEMPERATURE = 0.7
 DEFAULT_MAX_TOKENS = 4096
 
 # File paths
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
 DATA_DIR = PROJECT_ROOT / "data"
 RESEARCH_DIR = DATA_DIR / "research"
 REPORTS_DIR = DATA_DIR / "reports"
 LOGS_DIR = PROJECT_ROOT / "logs"
 CONFIG_DIR = PROJECT_ROOT / "config"
 
-# Ensure directories exist
-RESEARCH_DIR.mkdir(parents=True, exist_ok=True)
-REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
+# Directories are created by the components that write to them
+# (StorageManager, ReportExporter, setup_logging), not at import time.
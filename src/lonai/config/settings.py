@@ -3,12 +3,12 @@
 import os
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
-import yaml
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from lonai._yaml import load_yaml
 from lonai.config.constants import (
     CONFIG_DIR,
     DEFAULT_MAX_RESULTS,
@@ -22,13 +22,19 @@ from lonai.config.constants import (
 
 
 class Settings(BaseSettings):
-    """Application settings with validation."""
+    """Application settings with validation.
+    
+    Settings are frozen: they are shared process-wide via ``get_settings()``,
+    so per-call overrides must be passed as arguments instead of mutating
+    the instance.
+    """
     
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,
     )
     
     # API Keys (Required)
@@ -64,6 +70,17 @@ class Settings(BaseSettings):
         gt=0,
         description="Maximum tokens for agent response"
     )
+    agent_debug_dump: bool = Field(
+        default=False,
+        description="Dump the raw agent result of each research call to a debug file"
+    )
+    
+    # Batch Configuration
+    batch_concurrency: int = Field(
+        default=4,
+        gt=0,
+        description="Number of queries researched concurrently in batch mode"
+    )
     
     # Search Configuration
     search_max_results: int = Field(
@@ -103,6 +120,30 @@ class Settings(BaseSettings):
         default=True,
         description="Auto-save research results"
     )
+    storage_compress: bool = Field(
+        default=True,
+        description="Save research results as compact gzip-compressed JSON"
+    )
+    
+    # Research Cache Configuration
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache research results on disk"
+    )
+    cache_dir: Path = Field(
+        default=Path("data/cache"),
+        description="Research cache directory"
+    )
+    cache_max_entries: int = Field(
+        default=1000,
+        gt=0,
+        description="Maximum number of cached research results"
+    )
+    cache_ttl: int = Field(
+        default=86400,
+        gt=0,
+        description="Research cache TTL in seconds"
+    )
     
     # Export Configuration
     export_default_format: ExportFormat = Field(
@@ -133,21 +174,36 @@ class Settings(BaseSettings):
         # However, checking 'values' in pydantic v2 requires `info.data`.
         return v
     
-    @field_validator("storage_data_dir", "export_output_dir", "log_file", "skills_dir")
+    @field_validator("storage_data_dir", "cache_dir", "export_output_dir", "log_file", "skills_dir")
     @classmethod
     def ensure_path_exists(cls, v: Path) -> Path:
-        """Ensure path parent directories exist."""
+        """Resolve relative paths against the project root."""
         if v is None:
             return v
         if not v.is_absolute():
             # Make relative to project root
             from lonai.config.constants import PROJECT_ROOT
             v = PROJECT_ROOT / v
-        # Don't create parent for skills_dir, just resolve it
-        if v.name != "skills":
-            v.parent.mkdir(parents=True, exist_ok=True)
         return v
     
+    @model_validator(mode="after")
+    def ensure_parent_dirs(self) -> "Settings":
+        """Ensure parent directories of data paths exist.
+        
+        Parents are deduplicated (they usually share ``data/``) and only
+        created when missing. skills_dir is resolved but never created.
+        """
+        parents = {
+            self.storage_data_dir.parent,
+            self.cache_dir.parent,
+            self.export_output_dir.parent,
+            self.log_file.parent,
+        }
+        for parent in parents:
+            if not parent.is_dir():
+                parent.mkdir(parents=True, exist_ok=True)
+        return self
+    
     # Skills Configuration
     skills_dir: Optional[Path] = Field(
         default=Path("skills"),
@@ -168,18 +224,17 @@ class Settings(BaseSettings):
         if config_path is None:
             config_path = CONFIG_DIR / "config.yaml"
         
-        config_data = {}
+        config_data: Dict[str, Any] = {}
         if config_path.exists():
             with open(config_path, "r", encoding="utf-8") as f:
-                yaml_data = yaml.safe_load(f)
+                yaml_data = load_yaml(f.read())
                 
             # Flatten nested YAML structure
             if yaml_data:
                 for section, values in yaml_data.items():
                     if isinstance(values, dict):
-                        for key, value in values.items():
-                            config_key = f"{section}_{key}"
-                            config_data[config_key] = value
+                        prefix = section + "_"
+                        config_data.update((prefix + key, value) for key, value in values.items())
                     else:
                         config_data[section] = values
         
@@ -187,10 +242,13 @@ class Settings(BaseSettings):
         return cls(**config_data)
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance.
     
+    Settings are parsed and validated once per process; call
+    ``get_settings.cache_clear()`` to force a reload (e.g. in tests).
+    
     Returns:
         Singleton Settings instance.
     """
@@ -1,6 +1,19 @@
 """Core module for research assistant."""
 
-from lonai.core.agent import ResearchAgent
+from typing import TYPE_CHECKING, Any
+
+from lonai.core.cache import ResearchCache
 from lonai.core.prompts import PromptManager
 
-__all__ = ["ResearchAgent", "PromptManager"]
+if TYPE_CHECKING:
+    from lonai.core.agent import ResearchAgent
+
+__all__ = ["ResearchAgent", "ResearchCache", "PromptManager"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import ResearchAgent (and with it deepagents) on first access (PEP 562)."""
+    if name == "ResearchAgent":
+        from lonai.core.agent import ResearchAgent
+        return ResearchAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
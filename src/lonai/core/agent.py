@@ -1,19 +1,88 @@
 """Core research agent implementation using DeepAgents."""
 
+import io
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 
 from deepagents import create_deep_agent
+from langchain_core.messages import SystemMessage
 
+from lonai.config.constants import PROJECT_ROOT, AgentProvider, ExportFormat
 from lonai.config.settings import Settings, get_settings
+from lonai.core.backend import LocalExecutionBackend
+from lonai.core.cache import ResearchCache
 from lonai.core.prompts import PromptManager
 from lonai.tools.search import SearchTool
-from lonai.tools.storage import StorageManager
+from lonai.tools.storage import HistoryBatch, StorageManager
 from lonai.tools.export import ReportExporter
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+
+def _skills_available(skills_dir: Optional[Path]) -> bool:
+    """Check whether the skills directory exists."""
+    return skills_dir is not None and skills_dir.exists()
+
+
+@lru_cache(maxsize=8)
+def _get_backend(root_dir: str) -> LocalExecutionBackend:
+    """Return a shared execution backend for the given root directory."""
+    return LocalExecutionBackend(root_dir=root_dir)
+
+
+def _create_anthropic(settings: Settings, api_key: Optional[str]) -> Any:
+    from langchain_anthropic import ChatAnthropic
+    return ChatAnthropic(
+        model=settings.agent_model,
+        api_key=api_key,
+        temperature=settings.agent_temperature,
+        max_tokens=settings.agent_max_tokens,
+    )
+
+
+def _create_openai(settings: Settings, api_key: Optional[str]) -> Any:
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(
+        model=settings.agent_model,
+        api_key=api_key or "dummy",  # Custom/Local use cases might not strictly need key
+        base_url=settings.agent_base_url,
+        temperature=settings.agent_temperature,
+        max_tokens=settings.agent_max_tokens,
+    )
+
+
+def _create_google(settings: Settings, api_key: Optional[str]) -> Any:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(
+        model=settings.agent_model,
+        google_api_key=api_key,
+        temperature=settings.agent_temperature,
+        max_output_tokens=settings.agent_max_tokens,
+    )
+
+
+# Provider -> chat model factory; SDKs are imported only when their factory runs
+_PROVIDER_FACTORIES: Dict[AgentProvider, Callable[[Settings, Optional[str]], Any]] = {
+    AgentProvider.ANTHROPIC: _create_anthropic,
+    AgentProvider.OPENAI: _create_openai,
+    AgentProvider.CUSTOM: _create_openai,
+    AgentProvider.GOOGLE: _create_google,
+}
+
+# Provider -> settings field holding its API key (used when agent_api_key is unset)
+_PROVIDER_KEY_FIELDS: Dict[AgentProvider, str] = {
+    AgentProvider.ANTHROPIC: "anthropic_api_key",
+    AgentProvider.OPENAI: "openai_api_key",
+    AgentProvider.GOOGLE: "google_api_key",
+}
+
 
 class ResearchAgent:
     """Enterprise-grade research agent powered by DeepAgents.
@@ -37,47 +106,49 @@ class ResearchAgent:
         """
         self.settings = settings or get_settings()
         self.language = language
+        self.custom_instructions = custom_instructions
         self.prompt_manager = PromptManager(language=language)
         
         # Initialize tools
+        search_cache_path = (
+            self.settings.cache_dir / "search" if self.settings.search_cache_enabled else None
+        )
         self.search_tool = SearchTool(
             api_key=self.settings.tavily_api_key,
-            max_results=self.settings.search_max_results
-        )
-        
-        self.storage_manager = StorageManager(
-            data_dir=self.settings.storage_data_dir,
-            auto_save=self.settings.storage_auto_save
+            max_results=self.settings.search_max_results,
+            cache_path=search_cache_path,
+            cache_ttl=self.settings.search_cache_ttl
         )
         
-        self.report_exporter = ReportExporter(
-            output_dir=self.settings.export_output_dir
-        )
+        # Storage, export and cache helpers are created on first use
+        self._helpers_lock = threading.Lock()
         
         # Configure Model
         model = self._configure_model()
         
         # Create agent
-        system_prompt = self.prompt_manager.get_research_prompt(custom_instructions)
+        system_prompt: Union[str, SystemMessage]
+        if self.settings.agent_provider == AgentProvider.ANTHROPIC:
+            # Mark the static base prompt for prompt caching; any custom
+            # instructions follow in a separate, uncached block
+            system_prompt = SystemMessage(
+                content=[*self.prompt_manager.get_research_prompt_blocks(custom_instructions)]
+            )
+        else:
+            system_prompt = self.prompt_manager.get_research_prompt(custom_instructions)
         
         # Get skills directory if configured
         # FilesystemBackend uses relative paths (no leading slash)
         # Other backends like StateBackend use POSIX paths ("/skills/")
-        skills_dirs = ["skills"] if self.settings.skills_dir and self.settings.skills_dir.exists() else []
-        
-        # Configure Backend with execution support
-        from lonai.core.backend import LocalExecutionBackend
-        from pathlib import Path
-        
-        # Use project root as the filesystem root
-        project_root = Path(__file__).parent.parent.parent.parent
+        skills_dirs = ["skills"] if _skills_available(self.settings.skills_dir) else []
         
         self.agent = create_deep_agent(
             model=model,
             tools=[self.search_tool.get_function_definition()],
             system_prompt=system_prompt,
             skills=skills_dirs,
-            backend=LocalExecutionBackend(root_dir=str(project_root)),
+            # Use project root as the filesystem root, with execution support
+            backend=_get_backend(str(PROJECT_ROOT)),
             debug=False,  # Enable debug logging
         )
         
@@ -85,62 +156,67 @@ class ResearchAgent:
 
 
 
+    def _helper(self, name: str, factory: Callable[[], _T]) -> _T:
+        """Return the helper stored under name, creating it on first use.
+        
+        Guarded by a lock because batch_research() reaches the helpers from
+        worker threads, and two threads must not build separate instances.
+        """
+        helper: Optional[_T] = self.__dict__.get(name)
+        if helper is None:
+            with self._helpers_lock:
+                helper = self.__dict__.get(name)
+                if helper is None:
+                    helper = self.__dict__[name] = factory()
+        return helper
+    
+    @property
+    def storage_manager(self) -> StorageManager:
+        """Storage manager for research history, created on first use."""
+        return self._helper("_storage_manager", lambda: StorageManager(
+            data_dir=self.settings.storage_data_dir,
+            auto_save=self.settings.storage_auto_save,
+            compress=self.settings.storage_compress
+        ))
+    
+    @property
+    def report_exporter(self) -> ReportExporter:
+        """Report exporter, created on first use."""
+        return self._helper("_report_exporter", lambda: ReportExporter(
+            output_dir=self.settings.export_output_dir
+        ))
+    
+    @property
+    def research_cache(self) -> ResearchCache:
+        """Research result cache, created on first use."""
+        return self._helper("_research_cache", lambda: ResearchCache(
+            cache_dir=self.settings.cache_dir,
+            max_entries=self.settings.cache_max_entries,
+            ttl=self.settings.cache_ttl
+        ))
+    
     def _configure_model(self) -> Any:
         """Configure the LLM based on settings."""
-        from lonai.config.constants import AgentProvider
-        
         provider = self.settings.agent_provider
+        factory = _PROVIDER_FACTORIES.get(provider)
+        if factory is None:
+            raise ValueError(f"Unsupported provider: {provider}")
         
-        # Resolve API Key
+        # Resolve API Key: the generic key wins over the provider-specific one
         api_key = self.settings.agent_api_key
-        if not api_key:
-            if provider == AgentProvider.ANTHROPIC:
-                api_key = self.settings.anthropic_api_key
-            elif provider == AgentProvider.OPENAI:
-                api_key = self.settings.openai_api_key
-            elif provider == AgentProvider.GOOGLE:
-                api_key = self.settings.google_api_key
+        if not api_key and provider in _PROVIDER_KEY_FIELDS:
+            api_key = getattr(self.settings, _PROVIDER_KEY_FIELDS[provider])
         
-        if not api_key and provider != AgentProvider.CUSTOM:
-             # Logic is handled by pydantic validator mostly, but double check here
-             pass
-
-        if provider == AgentProvider.ANTHROPIC:
-            from langchain_anthropic import ChatAnthropic
-            return ChatAnthropic(
-                model=self.settings.agent_model,
-                api_key=api_key,
-                temperature=self.settings.agent_temperature,
-                max_tokens=self.settings.agent_max_tokens,
-            )
-            
-        elif provider == AgentProvider.OPENAI or provider == AgentProvider.CUSTOM:
-            from langchain_openai import ChatOpenAI
-            return ChatOpenAI(
-                model=self.settings.agent_model,
-                api_key=api_key or "dummy", # Custom/Local use cases might not strictly need key
-                base_url=self.settings.agent_base_url,
-                temperature=self.settings.agent_temperature,
-                max_tokens=self.settings.agent_max_tokens,
-            )
-            
-        elif provider == AgentProvider.GOOGLE:
-            from langchain_google_genai import ChatGoogleGenerativeAI
-            return ChatGoogleGenerativeAI(
-                model=self.settings.agent_model,
-                google_api_key=api_key,
-                temperature=self.settings.agent_temperature,
-                max_output_tokens=self.settings.agent_max_tokens,
-            )
-            
-        else:
-            raise ValueError(f"Unsupported provider: {provider}")
+        return factory(self.settings, api_key)
     
     def research(
         self,
         query: str,
         save_results: bool = True,
-        export_report: bool = False
+        export_report: bool = False,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        export_format: Optional[ExportFormat] = None
     ) -> Dict[str, Any]:
         """Conduct research on a given query.
         
@@ -148,65 +224,49 @@ class ResearchAgent:
             query: Research question or topic
             save_results: Whether to save results to storage
             export_report: Whether to export a formatted report
+            export_format: Report format (defaults to settings.export_default_format)
+            use_cache: Whether to consult and update the research cache
+            refresh_cache: Ignore any cached result but store the fresh one
             
         Returns:
             Dictionary containing:
             - query: The research query
             - response: Agent's response
+            - cached: True if the response came from the cache
             - saved_path: Path to saved results (if save_results=True)
             - report_path: Path to exported report (if export_report=True)
         """
         logger.info(f"Starting research: {query}")
         
         try:
-            # Invoke the agent
-            result = self.agent.invoke({
-                "messages": [{"role": "user", "content": query}]
-            })
-            
-            # DEBUG: Dump full result to file for analysis
-            try:
-                import json
-                DEBUG_FILE = os.path.join(self.settings.storage_data_dir, "debug_last_result.txt")
-                with open(DEBUG_FILE, "w", encoding="utf-8") as f:
-                    f.write(f"Query: {query}\n\n")
-                    f.write(f"Result Keys: {list(result.keys())}\n\n")
-                    f.write("Messages:\n")
-                    for i, msg in enumerate(result["messages"]):
-                        f.write(f"--- Message {i} ---\n")
-                        f.write(f"Type: {type(msg)}\n")
-                        f.write(f"Content: {repr(msg.content)}\n")
-                        f.write(f"Additional Kwargs: {msg.additional_kwargs}\n")
-                        if hasattr(msg, "tool_calls"):
-                            f.write(f"Tool Calls: {msg.tool_calls}\n")
-                        f.write("\n")
-                logger.info(f"Debug info saved to {DEBUG_FILE}")
-            except Exception as e:
-                logger.error(f"Failed to write debug log: {e}")
+            cache_key = None
+            cached = None
+            if use_cache and self.settings.cache_enabled:
+                cache_key = self.research_cache.make_key(
+                    query,
+                    self.language,
+                    self.settings.agent_provider,
+                    self.settings.agent_model,
+                    self.settings.agent_temperature,
+                    self.custom_instructions,
+                )
+                if not refresh_cache:
+                    cached = self.research_cache.get(cache_key)
             
-            # Extract response
-            # Robust extraction: find the last AI message with actual content.
-            # This handles cases where the final message might be empty (e.g. due to model quirks or tool artifacts).
-            response = ""
-            messages = result["messages"]
-            for msg in reversed(messages):
-                if msg.type == "ai":
-                    if msg.content:
-                        response = msg.content
-                        break
-                    # Fallback for DeepSeek/Reasoning models
-                    if msg.additional_kwargs.get("reasoning_content"):
-                        response = msg.additional_kwargs.get("reasoning_content")
-                        break
-            
-            # Fallback to the last message content if no valid AI message found
-            if not response and messages:
-                response = messages[-1].content
+            if cached is not None:
+                logger.info("Returning cached research result")
+                response = cached["response"]
+            else:
+                response = self._run_agent(query)
+                if cache_key:
+                    self.research_cache.set(cache_key, {"query": query, "response": response})
             
             output = {
                 "query": query,
                 "response": response,
             }
+            if cached is not None:
+                output["cached"] = True
             
             # Save results if requested
             if save_results:
@@ -222,7 +282,7 @@ class ResearchAgent:
                 report_path = self.report_exporter.export(
                     content=response,
                     title=query,
-                    format=self.settings.export_default_format,
+                    format=export_format or self.settings.export_default_format,
                     metadata={"query": query, "language": self.language}
                 )
                 output["report_path"] = str(report_path)
@@ -234,60 +294,140 @@ class ResearchAgent:
             logger.error(f"Research error: {e}")
             raise
     
+    def _run_agent(self, query: str) -> str:
+        """Invoke the deep agent and extract its final response.
+        
+        Args:
+            query: Research question or topic
+            
+        Returns:
+            The agent's response text
+        """
+        # Invoke the agent
+        result = self.agent.invoke({
+            "messages": [{"role": "user", "content": query}]
+        })
+        
+        if self.settings.agent_debug_dump:
+            self._dump_debug(query, result)
+        
+        # Extract response
+        # Robust extraction: find the last AI message with actual content.
+        # This handles cases where the final message might be empty (e.g. due to model quirks or tool artifacts).
+        messages = result["messages"]
+        response: str
+        for i in range(len(messages) - 1, -1, -1):
+            msg = messages[i]
+            if getattr(msg, "type", None) != "ai":
+                continue
+            if content := msg.content:
+                response = content
+                break
+            # Fallback for DeepSeek/Reasoning models
+            extra = msg.additional_kwargs
+            if extra and (reasoning := extra.get("reasoning_content")):
+                response = reasoning
+                break
+        else:
+            # Fallback to the last message content if no valid AI message found
+            response = messages[-1].content if messages else ""
+        
+        return response
+    
+    def _dump_debug(self, query: str, result: Dict[str, Any]) -> None:
+        """Dump the full agent result to a file for analysis.
+        
+        Args:
+            query: Research query
+            result: Raw result returned by the agent
+        """
+        debug_file = os.path.join(self.settings.storage_data_dir, "debug_last_result.txt")
+        try:
+            buf = io.StringIO()
+            buf.write(f"Query: {query}\n\n")
+            buf.write(f"Result Keys: {list(result.keys())}\n\n")
+            buf.write("Messages:\n")
+            for i, msg in enumerate(result["messages"]):
+                buf.write(f"--- Message {i} ---\n")
+                buf.write(f"Type: {type(msg)}\n")
+                buf.write(f"Content: {msg.content!r}\n")
+                buf.write(f"Additional Kwargs: {msg.additional_kwargs}\n")
+                if hasattr(msg, "tool_calls"):
+                    buf.write(f"Tool Calls: {msg.tool_calls}\n")
+                buf.write("\n")
+            
+            with open(debug_file, "w", encoding="utf-8") as f:
+                f.write(buf.getvalue())
+            logger.info(f"Debug info saved to {debug_file}")
+        except Exception as e:
+            logger.error(f"Failed to write debug log: {e}")
+    
     def batch_research(
         self,
         queries: List[str],
-        save_results: bool = True
+        save_results: bool = True,
+        max_workers: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Conduct research on multiple queries.
+        """Conduct research on multiple queries concurrently.
+        
+        Each query is network-bound (LLM + web search), so queries run on a
+        bounded thread pool to overlap their latency.
         
         Args:
             queries: List of research questions
             save_results: Whether to save results
+            max_workers: Maximum concurrent queries (defaults to settings.batch_concurrency)
             
         Returns:
-            List of result dictionaries
+            List of result dictionaries, in the same order as queries
         """
-        logger.info(f"Starting batch research: {len(queries)} queries")
+        total = len(queries)
+        logger.info(f"Starting batch research: {total} queries")
         
-        results = []
-        for i, query in enumerate(queries, 1):
-            logger.info(f"Processing query {i}/{len(queries)}: {query}")
+        def run(query: str) -> Dict[str, Any]:
             try:
-                result = self.research(
+                return self.research(
                     query=query,
                     save_results=save_results,
                     export_report=False
                 )
-                results.append(result)
             except Exception as e:
                 logger.error(f"Error processing query '{query}': {e}")
-                results.append({
+                return {
                     "query": query,
                     "error": str(e)
-                })
+                }
+        
+        # Results by query position; workers finish out of order
+        results: Dict[int, Dict[str, Any]] = {}
+        workers = max_workers or self.settings.batch_concurrency
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, query): i for i, query in enumerate(queries)}
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                logger.info(f"Completed query {done}/{total}")
         
         logger.info("Batch research completed")
-        return results
+        return [results[i] for i in range(total)]
     
-    def get_history(self, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+    def get_history(self, limit: Optional[int] = 10) -> HistoryBatch:
         """Get research history.
         
         Args:
             limit: Maximum number of records to return
             
         Returns:
-            List of research history metadata
+            Research history metadata as parallel columns
         """
-        return self.storage_manager.list_research(limit=limit)
+        return self.storage_manager.list_history(limit=limit)
     
-    def search_history(self, keyword: str) -> List[Dict[str, Any]]:
+    def search_history(self, keyword: str) -> HistoryBatch:
         """Search research history by keyword.
         
         Args:
             keyword: Search keyword
             
         Returns:
-            List of matching research records
+            Matching research records as parallel columns
         """
-        return self.storage_manager.search_research(keyword)
+        return self.storage_manager.search_history(keyword)
@@ -2,6 +2,15 @@ from deepagents.backends.filesystem import FilesystemBackend
 from deepagents.backends.protocol import ExecuteResponse, SandboxBackendProtocol
 import subprocess
 import os
+import shlex
+import sys
+from typing import Any, List, Optional, Union
+
+# Characters that require a real shell (pipes, redirection, expansion, ...)
+_SHELL_CHARS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+# Default command timeout in seconds (5 minutes)
+_DEFAULT_TIMEOUT = 300
+
 
 class LocalExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
     """
@@ -9,30 +18,54 @@ class LocalExecutionBackend(FilesystemBackend, SandboxBackendProtocol):
     This enables the 'execute' tool for the agent.
     """
     
-    def execute(self, command: str) -> ExecuteResponse:
-        """Execute a shell command locally."""
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Prepare environment with current python path once; later changes
+        # to os.environ are not picked up by this backend
+        self._env = {
+            **os.environ,
+            "PATH": os.path.dirname(sys.executable) + os.pathsep + os.environ.get("PATH", ""),
+        }
+    
+    def _run(self, command: str, timeout: int) -> "subprocess.CompletedProcess[bytes]":
+        """Run a command, skipping /bin/sh when no shell features are used."""
+        def run(args: Union[str, List[str]], shell: bool) -> "subprocess.CompletedProcess[bytes]":
+            return subprocess.run(
+                args, shell=shell, capture_output=True, cwd=self.cwd,
+                timeout=timeout, env=self._env,
+            )
+        
+        if not _SHELL_CHARS.intersection(command):
+            try:
+                args = shlex.split(command)
+            except ValueError:
+                args = None
+            if args:
+                try:
+                    return run(args, shell=False)
+                except OSError:
+                    # Shell builtins (cd, export, ...), missing or
+                    # non-executable programs: let the shell handle them
+                    # and report its usual exit status (127, 126, ...)
+                    pass
+        
+        # Use shell=True to support pipes and shell features
+        return run(command, shell=True)
+    
+    def execute(self, command: str, *, timeout: Optional[int] = None) -> ExecuteResponse:
+        """Execute a shell command locally.
+        
+        Args:
+            command: Command line to run
+            timeout: Timeout in seconds (defaults to 5 minutes)
+        """
         try:
-            # Prepare environment with current python path
-            import sys
-            env = os.environ.copy()
-            current_python_dir = os.path.dirname(sys.executable)
-            env["PATH"] = current_python_dir + os.pathsep + env.get("PATH", "")
-            
-            # Use shell=True to support pipes and shell features
             # Run in the configured root directory (cwd of the backend)
-            process = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                cwd=self.cwd,
-                timeout=300,  # 5 minutes timeout
-                env=env
-            )
+            process = self._run(command, timeout or _DEFAULT_TIMEOUT)
             
-            output = process.stdout
+            output = process.stdout.decode("utf-8", errors="replace")
             if process.stderr:
-                output += "\nSTDERR:\n" + process.stderr
+                output += "\nSTDERR:\n" + process.stderr.decode("utf-8", errors="replace")
                 
             return ExecuteResponse(
                 output=output,
@@ -0,0 +1,135 @@
+"""Persistent on-disk cache for research results."""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from lonai.utils import serialization
+
+logger = logging.getLogger(__name__)
+
+
+class ResearchCache:
+    """Disk-backed LRU cache of research results.
+    
+    Each entry is stored as a small JSON file named after the SHA-256 of its
+    key. File modification times track recency: reads touch the entry and
+    writes evict the least recently used entries beyond ``max_entries``.
+    Entries older than ``ttl`` seconds (by their ``cached_at`` timestamp)
+    are treated as misses.
+    """
+    
+    def __init__(self, cache_dir: Path, max_entries: int = 1000, ttl: Optional[float] = None):
+        """Initialize research cache.
+        
+        Args:
+            cache_dir: Directory for cache entries
+            max_entries: Maximum number of entries to keep
+            ttl: Maximum entry age in seconds (None: entries never expire)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.ttl = ttl
+    
+    @staticmethod
+    def make_key(query: str, *parts: Any) -> str:
+        """Build a cache key from a query and the settings that affect its result.
+        
+        The query is normalized (whitespace collapsed, case folded) so that
+        trivially different spellings of the same question share an entry.
+        
+        Args:
+            query: Research query
+            *parts: Additional key components (language, model, temperature, ...)
+        
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        normalized = " ".join(query.split()).casefold()
+        payload = json.dumps([normalized, *parts], ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        """Return the file holding the entry for a key."""
+        return self.cache_dir / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached result.
+        
+        Args:
+            key: Cache key from make_key()
+        
+        Returns:
+            Cached result dictionary, or None on a miss or an expired entry
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data: Dict[str, Any] = serialization.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Error reading cache entry {path}: {e}")
+            return None
+        
+        if self.ttl is not None and time.time() - data.get("cached_at", 0) >= self.ttl:
+            return None
+        
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+    
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a result and evict least recently used entries if needed.
+        
+        Caching is best-effort: errors are logged, never raised.
+        
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable result dictionary
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._path(key), 'wb') as f:
+                f.write(serialization.dumps({"cached_at": time.time(), **value}))
+            self._evict()
+        except Exception as e:
+            logger.warning(f"Error writing cache entry: {e}")
+    
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond max_entries.
+        
+        Other threads or processes may evict concurrently, so entries can
+        vanish between listing and stat/unlink.
+        """
+        entries = list(self.cache_dir.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+        dated = []
+        for path in entries:
+            try:
+                dated.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                pass
+        dated.sort(key=lambda item: item[0])
+        for _, path in dated[:len(dated) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        logger.info("Research cache cleared")
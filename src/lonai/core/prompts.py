@@ -1,6 +1,20 @@
 """Prompt management for the research agent."""
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+
+@lru_cache(maxsize=32)
+def _compose_research_prompt(base_prompt: str, custom_instructions: str) -> str:
+    """Append custom instructions to a base research prompt.
+    
+    Module-level so every PromptManager shares the composed strings.
+    """
+    return "".join((
+        base_prompt,
+        "\n\n## Additional Instructions\n\n",
+        custom_instructions,
+    ))
 
 
 class PromptManager:
@@ -228,6 +242,12 @@ Guidelines:
         """
         self.language = language
         self._custom_prompts: Dict[str, str] = {}
+        
+        # Resolve the language-specific prompts once
+        is_zh = language == "zh"
+        self._research_prompt = self.RESEARCH_PROMPT_ZH if is_zh else self.RESEARCH_PROMPT_EN
+        self._analysis_prompt = self.ANALYSIS_PROMPT_ZH if is_zh else self.ANALYSIS_PROMPT_EN
+        self._summary_prompt = self.SUMMARY_PROMPT_ZH if is_zh else self.SUMMARY_PROMPT_EN
     
     def get_research_prompt(self, custom_instructions: Optional[str] = None) -> str:
         """Get the research system prompt.
@@ -238,29 +258,45 @@ Guidelines:
         Returns:
             Complete system prompt for research tasks
         """
-        base_prompt = (
-            self.RESEARCH_PROMPT_ZH if self.language == "zh" 
-            else self.RESEARCH_PROMPT_EN
-        )
+        if not custom_instructions:
+            return self._research_prompt
         
-        if custom_instructions:
-            base_prompt = f"{base_prompt}\n\n## Additional Instructions\n\n{custom_instructions}"
+        return _compose_research_prompt(self._research_prompt, custom_instructions)
+    
+    def get_research_prompt_blocks(
+        self, custom_instructions: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get the research system prompt as content blocks for prompt caching.
+        
+        The static base prompt comes first and carries an Anthropic
+        ``cache_control`` marker, so it stays cached even when the custom
+        instructions that follow it differ between agents.
         
-        return base_prompt
+        Args:
+            custom_instructions: Optional custom instructions to append
+            
+        Returns:
+            List of text content blocks
+        """
+        blocks: List[Dict[str, Any]] = [{
+            "type": "text",
+            "text": self._research_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
+        if custom_instructions:
+            blocks.append({
+                "type": "text",
+                "text": f"\n\n## Additional Instructions\n\n{custom_instructions}",
+            })
+        return blocks
     
     def get_analysis_prompt(self) -> str:
         """Get the analysis system prompt."""
-        return (
-            self.ANALYSIS_PROMPT_ZH if self.language == "zh"
-            else self.ANALYSIS_PROMPT_EN
-        )
+        return self._analysis_prompt
     
     def get_summary_prompt(self) -> str:
         """Get the summary system prompt."""
-        return (
-            self.SUMMARY_PROMPT_ZH if self.language == "zh"
-            else self.SUMMARY_PROMPT_EN
-        )
+        return self._summary_prompt
     
     def add_custom_prompt(self, name: str, prompt: str) -> None:
         """Add a custom prompt template.
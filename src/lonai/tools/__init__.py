@@ -1,7 +1,7 @@
 """Tools module for research assistant."""
 
 from lonai.tools.search import SearchTool
-from lonai.tools.storage import StorageManager
+from lonai.tools.storage import HistoryBatch, StorageManager
 from lonai.tools.export import ReportExporter
 
-__all__ = ["SearchTool", "StorageManager", "ReportExporter"]
+__all__ = ["SearchTool", "StorageManager", "HistoryBatch", "ReportExporter"]
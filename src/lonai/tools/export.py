@@ -1,15 +1,47 @@
 """Report exporter for generating various output formats."""
 
-import json
 import logging
+import re
 from datetime import datetime
+from functools import lru_cache
+from importlib import resources
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from lonai.config.constants import ExportFormat
+from lonai.utils import serialization
+from lonai.utils.text import slugify
 
 logger = logging.getLogger(__name__)
 
+# Block-level markdown: headers, list items, and any other non-empty line
+_MD_BLOCK_RE = re.compile(r"^(#{1,3}) (.*)$|^[ \t]*- (.*)$|^(.*\S.*)$", re.MULTILINE)
+_MD_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_TEMPLATE_FIELD_RE = re.compile(r"\$(\w+)")
+
+
+def _md_block(match: "re.Match[str]") -> str:
+    hashes, header, item, paragraph = match.groups()
+    if hashes:
+        level = len(hashes)
+        return f"<h{level}>{header}</h{level}>"
+    if item is not None:
+        return f"<li>{item}</li>"
+    return f"<p>{paragraph}</p>"
+
+
+@lru_cache(maxsize=1)
+def _html_template_parts() -> Tuple[str, str]:
+    """Load the HTML report template once and split it around ``$content``.
+    
+    The ``$name`` placeholders are converted to ``str.format_map`` fields
+    (with the CSS braces escaped), so rendering is a single C-level pass.
+    """
+    source = resources.files("lonai").joinpath("templates/report.html").read_text(encoding="utf-8")
+    source = _TEMPLATE_FIELD_RE.sub(r"{\1}", source.replace("{", "{{").replace("}", "}}"))
+    head, tail = source.split("{content}", 1)
+    return head, tail
+
 
 class ReportExporter:
     """Exports research reports in various formats."""
@@ -22,7 +54,7 @@ class ReportExporter:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"ReportExporter initialized with output_dir: {self.output_dir}")
+        logger.info("ReportExporter initialized with output_dir: %s", self.output_dir)
     
     def export(
         self,
@@ -42,16 +74,16 @@ class ReportExporter:
         Returns:
             Path to the exported file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_title = "".join(c if c.isalnum() or c in (' ', '_') else '_' for c in title)
-        safe_title = safe_title.replace(' ', '_')[:50]
+        # One clock read for both the filename and the document timestamp
+        now = datetime.now()
+        safe_title = slugify(title)
         
         if format == ExportFormat.MARKDOWN:
-            return self._export_markdown(content, safe_title, timestamp, metadata)
+            return self._export_markdown(content, safe_title, now, metadata)
         elif format == ExportFormat.HTML:
-            return self._export_html(content, safe_title, title, timestamp, metadata)
+            return self._export_html(content, safe_title, title, now, metadata)
         elif format == ExportFormat.JSON:
-            return self._export_json(content, title, timestamp, metadata)
+            return self._export_json(content, safe_title, title, now, metadata)
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
@@ -59,34 +91,33 @@ class ReportExporter:
         self,
         content: str,
         safe_title: str,
-        timestamp: str,
+        now: datetime,
         metadata: Optional[Dict[str, Any]]
     ) -> Path:
         """Export as Markdown file."""
-        filename = f"{timestamp}_{safe_title}.md"
+        filename = f"{now:%Y%m%d_%H%M%S}_{safe_title}.md"
         filepath = self.output_dir / filename
         
         # Add metadata header
-        header = f"# {safe_title.replace('_', ' ').title()}\n\n"
-        header += f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
-        
+        parts = [
+            f"# {safe_title.replace('_', ' ').title()}\n\n",
+            f"*Generated: {now:%Y-%m-%d %H:%M:%S}*\n\n",
+        ]
         if metadata:
-            header += "## Metadata\n\n"
-            for key, value in metadata.items():
-                header += f"- **{key}**: {value}\n"
-            header += "\n---\n\n"
-        
-        full_content = header + content
+            parts.append("## Metadata\n\n")
+            parts.extend(f"- **{key}**: {value}\n" for key, value in metadata.items())
+            parts.append("\n---\n\n")
         
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+                f.write("".join(parts))
+                f.write(content)
             
-            logger.info(f"Markdown report exported to: {filepath}")
+            logger.info("Markdown report exported to: %s", filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"Error exporting markdown: {e}")
+            logger.error("Error exporting markdown: %s", e)
             raise
     
     def _export_html(
@@ -94,136 +125,74 @@ class ReportExporter:
         content: str,
         safe_title: str,
         title: str,
-        timestamp: str,
+        now: datetime,
         metadata: Optional[Dict[str, Any]]
     ) -> Path:
         """Export as HTML file with styling."""
-        filename = f"{timestamp}_{safe_title}.html"
+        filename = f"{now:%Y%m%d_%H%M%S}_{safe_title}.html"
         filepath = self.output_dir / filename
         
         # Convert markdown-style content to HTML (basic conversion)
-        html_content = content.replace('\n', '<br>\n')
-        html_content = self._simple_markdown_to_html(html_content)
+        html_content = self._simple_markdown_to_html(content)
         
         # Build metadata section
         metadata_html = ""
         if metadata:
-            metadata_html = "<div class='metadata'><h2>Metadata</h2><ul>"
-            for key, value in metadata.items():
-                metadata_html += f"<li><strong>{key}:</strong> {value}</li>"
-            metadata_html += "</ul></div>"
-        
-        # Create complete HTML document
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            line-height: 1.6;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 40px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #34495e;
-            margin-top: 30px;
-        }}
-        .timestamp {{
-            color: #7f8c8d;
-            font-style: italic;
-            margin-bottom: 20px;
-        }}
-        .metadata {{
-            background-color: #ecf0f1;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 20px 0;
-        }}
-        .metadata ul {{
-            list-style-type: none;
-            padding-left: 0;
-        }}
-        .content {{
-            margin-top: 30px;
-        }}
-        code {{
-            background-color: #f8f8f8;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>{title}</h1>
-        <div class="timestamp">Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</div>
-        {metadata_html}
-        <div class="content">
-            {html_content}
-        </div>
-    </div>
-</body>
-</html>
-"""
+            items = "".join(
+                f"<li><strong>{key}:</strong> {value}</li>" for key, value in metadata.items()
+            )
+            metadata_html = f"<div class='metadata'><h2>Metadata</h2><ul>{items}</ul></div>"
+        
+        # Render the document around the content, which is written as-is
+        # rather than copied into one large string
+        head, tail = _html_template_parts()
+        fields = {
+            "title": title,
+            "generated": now.strftime('%Y-%m-%d %H:%M:%S'),
+            "metadata_html": metadata_html,
+        }
         
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(html)
+                f.write(head.format_map(fields))
+                f.write(html_content)
+                f.write(tail.format_map(fields))
             
-            logger.info(f"HTML report exported to: {filepath}")
+            logger.info("HTML report exported to: %s", filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"Error exporting HTML: {e}")
+            logger.error("Error exporting HTML: %s", e)
             raise
     
     def _export_json(
         self,
         content: str,
+        safe_title: str,
         title: str,
-        timestamp: str,
+        now: datetime,
         metadata: Optional[Dict[str, Any]]
     ) -> Path:
         """Export as JSON file."""
-        safe_title = "".join(c if c.isalnum() or c in (' ', '_') else '_' for c in title)
-        safe_title = safe_title.replace(' ', '_')[:50]
-        
-        filename = f"{timestamp}_{safe_title}.json"
+        filename = f"{now:%Y%m%d_%H%M%S}_{safe_title}.json"
         filepath = self.output_dir / filename
         
         data = {
             "title": title,
             "content": content,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "metadata": metadata or {},
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(serialization.dumps(data, indent=True))
             
-            logger.info(f"JSON report exported to: {filepath}")
+            logger.info("JSON report exported to: %s", filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"Error exporting JSON: {e}")
+            logger.error("Error exporting JSON: %s", e)
             raise
     
     def _simple_markdown_to_html(self, text: str) -> str:
@@ -236,25 +205,5 @@ class ReportExporter:
             HTML text
         """
         # This is a very basic conversion - for production use a proper markdown library
-        lines = text.split('\n')
-        result = []
-        
-        for line in lines:
-            # Headers
-            if line.startswith('### '):
-                result.append(f"<h3>{line[4:]}</h3>")
-            elif line.startswith('## '):
-                result.append(f"<h2>{line[3:]}</h2>")
-            elif line.startswith('# '):
-                result.append(f"<h1>{line[2:]}</h1>")
-            # Bold
-            elif '**' in line:
-                line = line.replace('**', '<strong>', 1).replace('**', '</strong>', 1)
-                result.append(line)
-            # Lists
-            elif line.strip().startswith('- '):
-                result.append(f"<li>{line.strip()[2:]}</li>")
-            else:
-                result.append(line)
-        
-        return '\n'.join(result)
+        html = _MD_BLOCK_RE.sub(_md_block, text)
+        return _MD_BOLD_RE.sub(r"<strong>\1</strong>", html)
@@ -1,28 +1,89 @@
 """Search tool using Tavily API."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Literal, Optional
-
-from tavily import TavilyClient
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple
 
 from lonai.config.constants import SearchTopic
+from lonai.core.cache import ResearchCache
+
+if TYPE_CHECKING:
+    from tavily import AsyncTavilyClient, TavilyClient
 
 logger = logging.getLogger(__name__)
 
+# Tavily (and the HTTP stack behind it) is imported on first use
+_TAVILY_NAMES = ("TavilyClient", "AsyncTavilyClient")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _TAVILY_NAMES:
+        import tavily
+        value = getattr(tavily, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _tavily(name: str) -> Any:
+    """Resolve a Tavily class, importing tavily on first use."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str) -> "TavilyClient":
+    """Return a Tavily client shared by all SearchTool instances using api_key.
+    
+    Sharing the client shares its HTTP session, so connections (and TLS
+    handshakes) are reused across tools and agents.
+    """
+    client = _tavily("TavilyClient")(api_key=api_key)
+    session = getattr(client, "session", None)
+    if session is not None:
+        from requests.adapters import HTTPAdapter
+        # Room for concurrent searches from batch research threads
+        session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+    return client
+
 
 class SearchTool:
     """Search tool for conducting internet searches using Tavily."""
     
-    def __init__(self, api_key: str, max_results: int = 5):
+    def __init__(
+        self,
+        api_key: str,
+        max_results: int = 5,
+        cache_size: int = 256,
+        cache_path: Optional[Path] = None,
+        cache_ttl: int = 3600,
+    ):
         """Initialize search tool.
         
         Args:
             api_key: Tavily API key
             max_results: Maximum number of search results
+            cache_size: Maximum number of search results kept in memory
+            cache_path: Directory for a persistent search cache (disabled if None)
+            cache_ttl: Lifetime of persistent cache entries in seconds
         """
-        self.client = TavilyClient(api_key=api_key)
+        self.client = _get_client(api_key)
+        self._api_key = api_key
+        self._async_client: Optional["AsyncTavilyClient"] = None  # created on first asearch()
         self.max_results = max_results
-        self._cache: Dict[str, Any] = {}
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache: "OrderedDict[Tuple[str, str, int, bool], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_cache = (
+            ResearchCache(cache_dir=cache_path, ttl=cache_ttl) if cache_path else None
+        )
         logger.info("SearchTool initialized")
     
     def search(
@@ -48,40 +109,176 @@ class SearchTool:
             - results: List of search result dictionaries
             - answer: AI-generated answer (if available)
         """
-        cache_key = f"{query}:{topic}:{max_results}:{include_raw_content}"
-        
-        # Check cache
-        if cache_key in self._cache:
-            logger.info(f"Returning cached results for query: {query}")
-            return self._cache[cache_key]
+        cache_key = self._cache_key(query, max_results, topic, include_raw_content)
+        cached, disk_key = self._lookup(query, cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            logger.info(f"Searching for: {query} (topic: {topic})")
+            logger.info("Searching for: %s (topic: %s)", query, topic)
             
             results = self.client.search(
                 query=query,
-                max_results=max_results or self.max_results,
+                max_results=cache_key[2],
                 topic=topic,
                 include_raw_content=include_raw_content,
             )
             
-            # Cache results
-            self._cache[cache_key] = results
+            self._store(cache_key, disk_key, results)
+            return results
             
-            logger.info(f"Found {len(results.get('results', []))} results")
+        except Exception as e:
+            logger.error("Search error: %s", e)
+            return self._error_result(query, e)
+    
+    async def asearch(
+        self,
+        query: str,
+        max_results: Optional[int] = None,
+        topic: Literal["general", "news", "finance"] = "general",
+        include_raw_content: bool = False,
+    ) -> Dict[str, Any]:
+        """Run a web search without blocking the event loop.
+        
+        Same arguments, caching and result format as search(), but uses
+        Tavily's async client so several searches can be in flight at once.
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return (default: uses instance setting)
+            topic: Search topic category (general, news, or finance)
+            include_raw_content: Whether to include raw HTML content
+            
+        Returns:
+            Dictionary containing search results (see search())
+        """
+        cache_key = self._cache_key(query, max_results, topic, include_raw_content)
+        cached, disk_key = self._lookup(query, cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            logger.info("Searching for: %s (topic: %s)", query, topic)
+            
+            if self._async_client is None:
+                self._async_client = _tavily("AsyncTavilyClient")(api_key=self._api_key)
+            results = await self._async_client.search(
+                query=query,
+                max_results=cache_key[2],
+                topic=topic,
+                include_raw_content=include_raw_content,
+            )
+            
+            self._store(cache_key, disk_key, results)
             return results
             
         except Exception as e:
-            logger.error(f"Search error: {e}")
-            return {
-                "query": query,
-                "results": [],
-                "error": str(e),
-            }
+            logger.error("Search error: %s", e)
+            return self._error_result(query, e)
+    
+    async def asearch_many(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several searches concurrently.
+        
+        A search that fails outright (e.g. a spec with bad arguments, or a
+        cancelled request) yields an error result in its slot instead of
+        cancelling the others.
+        
+        Args:
+            specs: Keyword arguments for asearch(), one dict per search
+            
+        Returns:
+            Search results in the same order as specs
+        """
+        async def run(spec: Dict[str, Any]) -> Dict[str, Any]:
+            # Awaited inside the task so bad keyword arguments fail just this search
+            return await self.asearch(**spec)
+        
+        outcomes = await asyncio.gather(*(run(spec) for spec in specs), return_exceptions=True)
+        results = []
+        for spec, outcome in zip(specs, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Search error: %s", outcome)
+                outcome = self._error_result(spec.get("query", ""), outcome)
+            results.append(outcome)
+        return results
+    
+    def _cache_key(
+        self,
+        query: str,
+        max_results: Optional[int],
+        topic: str,
+        include_raw_content: bool,
+    ) -> Tuple[str, str, int, bool]:
+        """Build the cache key; whitespace and case differences don't change the search."""
+        normalized = " ".join(query.split()).casefold()
+        return (normalized, topic, max_results or self.max_results, include_raw_content)
+    
+    def _lookup(
+        self,
+        query: str,
+        cache_key: Tuple[str, str, int, bool],
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Look up cached results in memory, then on disk.
+        
+        Returns:
+            Tuple of (cached results or None, disk cache key or None)
+        """
+        # Cached results are shared; callers must not mutate them
+        with self._lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info("Returning cached results for query: %s", query)
+            return cached, None
+        
+        if self._disk_cache is None:
+            return None, None
+        
+        disk_key = ResearchCache.make_key(*cache_key)
+        entry = self._disk_cache.get(disk_key)
+        if entry:
+            logger.info("Returning persisted results for query: %s", query)
+            self._remember(cache_key, entry["results"])
+            return entry["results"], disk_key
+        return None, disk_key
+    
+    def _store(
+        self,
+        cache_key: Tuple[str, str, int, bool],
+        disk_key: Optional[str],
+        results: Dict[str, Any],
+    ) -> None:
+        """Cache fresh results in memory and, if enabled, on disk."""
+        self._remember(cache_key, results)
+        if disk_key is not None and self._disk_cache is not None:
+            self._disk_cache.set(disk_key, {"results": results})
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Found %d results", len(results.get('results', [])))
+    
+    def _remember(self, cache_key: Tuple[str, str, int, bool], results: Dict[str, Any]) -> None:
+        """Store results in memory, evicting the least recently used entry."""
+        with self._lock:
+            self._cache[cache_key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    @staticmethod
+    def _error_result(query: str, error: BaseException) -> Dict[str, Any]:
+        """Result returned when a search fails."""
+        return {
+            "query": query,
+            "results": [],
+            "error": str(error),
+        }
     
     def clear_cache(self) -> None:
-        """Clear the search cache."""
-        self._cache.clear()
+        """Clear the search cache, including persisted entries."""
+        with self._lock:
+            self._cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.clear()
         logger.info("Search cache cleared")
     
     def get_function_definition(self) -> callable:
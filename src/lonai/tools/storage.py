@@ -1,70 +1,185 @@
 """Storage manager for persisting research data."""
 
-import json
+import asyncio
+import gzip
 import logging
+import os
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from lonai.utils import serialization
+from lonai.utils.text import slugify
 
 logger = logging.getLogger(__name__)
 
+# History index kept next to the research files (not matched by the globs below)
+INDEX_FILENAME = ".index.jsonl"
+
+# Saved research files: plain JSON, or compact gzip-compressed JSON
+RESEARCH_GLOBS = ("*.json", "*.json.gz")
+
+# One lock per index file, shared by every StorageManager in the process.
+# The locks are in-process only: a data dir is assumed to be written by a
+# single process at a time. A rewrite of the index (_write_index) can drop
+# a line another process appends concurrently; deleting the index file
+# forces a rebuild from the research files.
+_INDEX_LOCKS: Dict[str, threading.RLock] = {}
+_INDEX_LOCKS_GUARD = threading.Lock()
+
+
+def _get_index_lock(index_path: Path) -> threading.RLock:
+    """Return the lock guarding updates to the given history index."""
+    with _INDEX_LOCKS_GUARD:
+        return _INDEX_LOCKS.setdefault(os.path.abspath(index_path), threading.RLock())
+
+
+@dataclass
+class HistoryBatch:
+    """Research history stored as parallel columns (one list per field).
+    
+    Large histories are scanned column-wise, which avoids allocating a
+    dictionary per record.
+    """
+    
+    queries: List[str] = field(default_factory=list)
+    timestamps: List[str] = field(default_factory=list)
+    filenames: List[str] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.queries)
+    
+    def __iter__(self) -> Iterator[Tuple[str, str, str, str]]:
+        """Iterate over (query, timestamp, filename, path) rows."""
+        return zip(self.queries, self.timestamps, self.filenames, self.paths)
+    
+    def append(self, query: str, timestamp: str, filename: str, path: str) -> None:
+        """Append one record."""
+        self.queries.append(query)
+        self.timestamps.append(timestamp)
+        self.filenames.append(filename)
+        self.paths.append(path)
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """Convert to a list of per-record dictionaries."""
+        return [
+            {"filename": filename, "query": query, "timestamp": timestamp, "path": path}
+            for query, timestamp, filename, path in self
+        ]
+
 
 class StorageManager:
     """Manages storage and retrieval of research data."""
     
-    def __init__(self, data_dir: Path, auto_save: bool = True):
+    def __init__(self, data_dir: Path, auto_save: bool = True, compress: bool = True):
         """Initialize storage manager.
         
         Args:
             data_dir: Directory for storing research data
             auto_save: Whether to automatically save data
+            compress: Save results as compact gzip-compressed JSON (``.json.gz``)
+                instead of indented plain JSON
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.auto_save = auto_save
-        logger.info(f"StorageManager initialized with data_dir: {self.data_dir}")
+        self.compress = compress
+        self._index_lock = _get_index_lock(self.index_path)
+        # (index stat signature, history, lowercased queries, trigram -> row ids)
+        self._search_index: Optional[
+            Tuple[Tuple[int, int], HistoryBatch, List[str], Dict[str, Set[int]]]
+        ] = None
+        logger.info("StorageManager initialized with data_dir: %s", self.data_dir)
     
     def save_research(
         self,
         query: str,
         results: Any,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        fsync: bool = False
     ) -> Path:
         """Save research results to disk.
         
+        The file is written to a temporary file and atomically moved into
+        place, so a crash never leaves a truncated result behind.
+        
         Args:
             query: Research query
             results: Research results (can be any JSON-serializable data)
             metadata: Optional metadata to include
+            fsync: Flush the file to stable storage before returning
             
         Returns:
             Path to the saved file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_query = "".join(c if c.isalnum() or c in (' ', '_') else '_' for c in query)
-        safe_query = safe_query.replace(' ', '_')[:50]  # Limit filename length
+        now = datetime.now()
+        safe_query = slugify(query)
         
-        filename = f"{timestamp}_{safe_query}.json"
+        filename = f"{now:%Y%m%d_%H%M%S}_{safe_query}{'.json.gz' if self.compress else '.json'}"
         filepath = self.data_dir / filename
         
         data = {
             "query": query,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "results": results,
             "metadata": metadata or {},
         }
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if self.compress:
+                # Level 1: most of the size win at a fraction of the CPU cost
+                payload = gzip.compress(serialization.dumps(data), compresslevel=1)
+            else:
+                payload = serialization.dumps(data, indent=True)
             
-            logger.info(f"Research saved to: {filepath}")
+            # Unique per writer, hidden, and not matched by RESEARCH_GLOBS
+            tmp_path = filepath.with_name(f".{filename}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, filepath)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            
+            self._append_index(filename, query, data["timestamp"])
+            logger.info("Research saved to: %s", filepath)
             return filepath
             
         except Exception as e:
-            logger.error(f"Error saving research: {e}")
+            logger.error("Error saving research: %s", e)
             raise
     
+    async def asave_research(
+        self,
+        query: str,
+        results: Any,
+        metadata: Optional[Dict[str, Any]] = None,
+        fsync: bool = False
+    ) -> Path:
+        """Save research results to disk without blocking the event loop.
+        
+        The write runs on a worker thread so it can overlap with other
+        in-flight network calls.
+        
+        Args:
+            query: Research query
+            results: Research results (can be any JSON-serializable data)
+            metadata: Optional metadata to include
+            fsync: Flush the file to stable storage before returning
+            
+        Returns:
+            Path to the saved file
+        """
+        return await asyncio.to_thread(self.save_research, query, results, metadata, fsync)
+    
     def load_research(self, filename: str) -> Optional[Dict[str, Any]]:
         """Load research results from disk.
         
@@ -77,20 +192,145 @@ class StorageManager:
         filepath = self.data_dir / filename
         
         if not filepath.exists():
-            logger.warning(f"File not found: {filepath}")
+            logger.warning("File not found: %s", filepath)
             return None
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_file(filepath)
             
-            logger.info(f"Research loaded from: {filepath}")
+            logger.info("Research loaded from: %s", filepath)
             return data
             
         except Exception as e:
-            logger.error(f"Error loading research: {e}")
+            logger.error("Error loading research: %s", e)
             return None
     
+    @staticmethod
+    def _read_file(filepath: Path) -> Any:
+        """Read a research file, decompressing it if needed."""
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        if filepath.suffix == ".gz":
+            raw = gzip.decompress(raw)
+        return serialization.loads(raw)
+    
+    @property
+    def index_path(self) -> Path:
+        """Path of the history index (one JSON line per saved result)."""
+        return self.data_dir / INDEX_FILENAME
+    
+    def _append_index(self, filename: str, query: str, timestamp: str) -> None:
+        """Record a saved result in the history index."""
+        entry = {"filename": filename, "query": query, "timestamp": timestamp}
+        with self._index_lock:
+            if not self.index_path.exists():
+                # First save with this data dir (or index removed): include older files too
+                self._reindex()
+                return
+            
+            try:
+                with open(self.index_path, 'ab') as f:
+                    f.write(serialization.dumps(entry) + b"\n")
+            except Exception as e:
+                logger.warning("Error updating history index: %s", e)
+    
+    def _ensure_index(self) -> None:
+        """Rebuild the history index if it is missing."""
+        with self._index_lock:
+            if not self.index_path.exists():
+                self._reindex()
+    
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the history index, oldest first, keyed by filename."""
+        entries: Dict[str, Dict[str, Any]] = {}
+        with open(self.index_path, 'rb') as f:
+            for line in f:
+                try:
+                    entry = serialization.loads(line)
+                except Exception:
+                    continue
+                # A later line for the same file replaces the earlier one
+                entries.pop(entry["filename"], None)
+                entries[entry["filename"]] = entry
+        return entries
+    
+    def _write_index(self, entries: List[Dict[str, Any]]) -> None:
+        """Replace the history index with the given entries.
+        
+        Written to a temporary file and atomically moved into place, so
+        readers never see a partially written index. Callers hold the
+        index lock, which only serializes writers within this process.
+        """
+        tmp_path = self.index_path.with_name(
+            f"{INDEX_FILENAME}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.writelines(serialization.dumps(entry) + b"\n" for entry in entries)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _reindex(self) -> None:
+        """Rebuild the history index by reading every research file.
+        
+        Callers hold the index lock, so this blocks other saves to the same
+        data dir while every file is parsed. It only runs when the index is
+        missing, i.e. on the first save or listing after upgrading an
+        existing data dir.
+        """
+        files = sorted(
+            (path for pattern in RESEARCH_GLOBS for path in self.data_dir.glob(pattern)),
+            key=lambda p: p.stat().st_mtime
+        )
+        
+        entries = []
+        for filepath in files:
+            try:
+                data = self._read_file(filepath)
+            except Exception as e:
+                logger.warning("Error reading %s: %s", filepath, e)
+                continue
+            entries.append({
+                "filename": filepath.name,
+                "query": data.get("query", ""),
+                "timestamp": data.get("timestamp", ""),
+            })
+        
+        self._write_index(entries)
+        logger.info("Rebuilt history index with %d entries", len(entries))
+    
+    def list_history(self, limit: Optional[int] = None) -> HistoryBatch:
+        """List saved research as parallel columns.
+        
+        Reads the history index instead of opening every research file;
+        the index is rebuilt from the files if it is missing.
+        
+        Args:
+            limit: Maximum number of files to return (most recent first)
+            
+        Returns:
+            HistoryBatch with one entry per saved research file
+        """
+        self._ensure_index()
+        
+        entries = list(self._read_index().values())
+        entries.reverse()
+        if limit:
+            entries = entries[:limit]
+        
+        history = HistoryBatch()
+        for entry in entries:
+            history.append(
+                query=entry.get("query", ""),
+                timestamp=entry.get("timestamp", ""),
+                filename=entry["filename"],
+                path=str(self.data_dir / entry["filename"]),
+            )
+        
+        return history
+    
     def list_research(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """List all saved research files.
         
@@ -100,32 +340,62 @@ class StorageManager:
         Returns:
             List of research file metadata
         """
-        files = sorted(
-            self.data_dir.glob("*.json"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True
-        )
+        return self.list_history(limit=limit).records()
+    
+    def _get_search_index(self) -> Tuple[HistoryBatch, List[str], Dict[str, Set[int]]]:
+        """Return the trigram index over saved queries, rebuilding it when
+        the history index file has changed since it was built."""
+        self._ensure_index()
+        stat = self.index_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
         
-        if limit:
-            files = files[:limit]
+        if self._search_index is None or self._search_index[0] != signature:
+            history = self.list_history()
+            lowered = [query.lower() for query in history.queries]
+            trigrams: Dict[str, Set[int]] = defaultdict(set)
+            for row, query in enumerate(lowered):
+                for i in range(len(query) - 2):
+                    trigrams[query[i:i + 3]].add(row)
+            self._search_index = (signature, history, lowered, dict(trigrams))
         
-        results = []
-        for filepath in files:
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                results.append({
-                    "filename": filepath.name,
-                    "query": data.get("query", ""),
-                    "timestamp": data.get("timestamp", ""),
-                    "path": str(filepath),
-                })
-            except Exception as e:
-                logger.warning(f"Error reading {filepath}: {e}")
-                continue
+        return self._search_index[1:]
+    
+    def search_history(self, keyword: str) -> HistoryBatch:
+        """Search saved research by keyword, returning parallel columns.
+        
+        Matching is a case-insensitive substring test on the query. For
+        keywords of three or more characters, candidates are first narrowed
+        with a trigram index that is cached until the history changes.
         
-        return results
+        Args:
+            keyword: Keyword to search for in queries
+            
+        Returns:
+            HistoryBatch of matching research files
+        """
+        history, lowered, trigrams = self._get_search_index()
+        keyword_lower = keyword.lower()
+        
+        rows: Any = range(len(lowered))
+        if len(keyword_lower) >= 3:
+            candidates: Set[int] = set()
+            for i in range(len(keyword_lower) - 2):
+                ids = trigrams.get(keyword_lower[i:i + 3])
+                if not ids:
+                    return HistoryBatch()
+                candidates = ids if i == 0 else candidates & ids
+            rows = sorted(candidates)
+        
+        result = HistoryBatch()
+        for row in rows:
+            if keyword_lower in lowered[row]:
+                result.append(
+                    query=history.queries[row],
+                    timestamp=history.timestamps[row],
+                    filename=history.filenames[row],
+                    path=history.paths[row],
+                )
+        return result
     
     def search_research(self, keyword: str) -> List[Dict[str, Any]]:
         """Search for research files by keyword.
@@ -136,13 +406,7 @@ class StorageManager:
         Returns:
             List of matching research file metadata
         """
-        all_research = self.list_research()
-        keyword_lower = keyword.lower()
-        
-        return [
-            r for r in all_research
-            if keyword_lower in r.get("query", "").lower()
-        ]
+        return self.search_history(keyword).records()
     
     def delete_research(self, filename: str) -> bool:
         """Delete a research file.
@@ -158,11 +422,16 @@ class StorageManager:
         try:
             if filepath.exists():
                 filepath.unlink()
-                logger.info(f"Deleted research file: {filepath}")
+                with self._index_lock:
+                    if self.index_path.exists():
+                        entries = self._read_index()
+                        if entries.pop(filename, None) is not None:
+                            self._write_index(list(entries.values()))
+                logger.info("Deleted research file: %s", filepath)
                 return True
             else:
-                logger.warning(f"File not found: {filepath}")
+                logger.warning("File not found: %s", filepath)
                 return False
         except Exception as e:
-            logger.error(f"Error deleting research: {e}")
+            logger.error("Error deleting research: %s", e)
             return False
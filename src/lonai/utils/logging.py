@@ -1,15 +1,78 @@
 """Logging configuration."""
 
+import atexit
+import copy
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
-
-import yaml
+from typing import Any, Dict, List, Optional, Tuple
 
+from lonai._yaml import load_yaml
 from lonai.config.constants import CONFIG_DIR, LOGS_DIR
 
+# Parsed logging configs keyed by (path, mtime_ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# Background listeners that own the file handlers
+_LISTENERS: List[logging.handlers.QueueListener] = []
+
+
+def _load_config(config_path: Path) -> Dict[str, Any]:
+    """Parse a YAML logging config, reusing the result until the file changes.
+    
+    Returns a deep copy so callers can modify it without touching the cache.
+    """
+    key = (str(config_path), config_path.stat().st_mtime_ns)
+    config = _CONFIG_CACHE.get(key)
+    if config is None:
+        with open(config_path, 'rb') as f:
+            config = load_yaml(f)
+        _CONFIG_CACHE[key] = config
+    return copy.deepcopy(config)
+
+
+def _stop_listeners() -> None:
+    """Flush queued records and stop all background listeners."""
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+
+
+atexit.register(_stop_listeners)
+
+
+def _queue_file_handlers() -> None:
+    """Move file writes off the logging threads.
+    
+    Every FileHandler attached to a configured logger is replaced by a
+    QueueHandler, and a QueueListener thread performs the actual writes.
+    """
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    
+    queue_handlers: Dict[logging.Handler, logging.Handler] = {}
+    for logger in loggers:
+        for handler in list(logger.handlers):
+            if not isinstance(handler, logging.FileHandler):
+                continue
+            queue_handler = queue_handlers.get(handler)
+            if queue_handler is None:
+                records: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+                queue_handler = logging.handlers.QueueHandler(records)
+                queue_handler.setLevel(handler.level)
+                listener = logging.handlers.QueueListener(
+                    records, handler, respect_handler_level=True
+                )
+                listener.start()
+                _LISTENERS.append(listener)
+                queue_handlers[handler] = queue_handler
+            logger.removeHandler(handler)
+            logger.addHandler(queue_handler)
+
 
 def setup_logging(
     config_path: Optional[Path] = None,
@@ -26,14 +89,16 @@ def setup_logging(
     # Ensure logs directory exists
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     
+    # Flush and stop listeners from a previous call before reconfiguring
+    _stop_listeners()
+    
     # Try to load from config file
     if config_path is None:
         config_path = CONFIG_DIR / "logging.yaml"
     
     if config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = _load_config(config_path)
             
             # Override log file if specified
             if log_file:
@@ -42,6 +107,7 @@ def setup_logging(
                         handler['filename'] = str(log_file)
             
             logging.config.dictConfig(config)
+            _queue_file_handlers()
             
             # Override log level if specified
             if log_level:
@@ -68,6 +134,7 @@ def setup_logging(
         format=log_format,
         handlers=handlers
     )
+    _queue_file_handlers()
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -0,0 +1,46 @@
+"""JSON serialization helpers.
+
+Uses ``orjson`` (serialization in native code) when it is installed and
+falls back to the standard library ``json`` module otherwise. Both paths
+produce UTF-8 encoded bytes with non-ASCII characters left unescaped.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON.
+    
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+    
+    Args:
+        data: Encoded JSON document
+        
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,39 @@
+"""Text helpers."""
+
+from typing import Dict
+
+
+class _SlugTable(Dict[int, int]):
+    """str.translate table mapping every character except letters, digits,
+    spaces and underscores to ``_``.
+
+    ASCII is precomputed; other code points are classified on first sight
+    and memoized, so the table never has to cover all of Unicode up front.
+    """
+
+    def __missing__(self, codepoint: int) -> int:
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in " _" else ord("_")
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
+for _codepoint in range(128):
+    _SLUG_TABLE.__missing__(_codepoint)
+
+
+def slugify(text: str, max_length: int = 50) -> str:
+    """Turn arbitrary text into a filename-safe slug.
+
+    Letters and digits (including non-ASCII ones) are kept, every other
+    character becomes ``_``, and spaces become ``_``.
+
+    Args:
+        text: Text to convert (e.g. a query or report title)
+        max_length: Maximum length of the slug
+
+    Returns:
+        Slug suitable for use in a filename
+    """
+    return text.translate(_SLUG_TABLE).replace(" ", "_")[:max_length]
@@ -2,8 +2,34 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import FrozenSet, Optional, Tuple
+
+# CJK Unified Ideographs, used to detect Chinese text
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
+# Characters not allowed in filenames (plus spaces) map to underscores
+_FILENAME_INVALID = frozenset('<>:"/\\|?* ')
+_FILENAME_TRANSLATE = str.maketrans({c: '_' for c in _FILENAME_INVALID})
+# Same mapping as a 256-byte table for the (common) pure-ASCII case
+_FILENAME_BYTE_TABLE = bytes(ord('_') if chr(i) in _FILENAME_INVALID else i for i in range(256))
+
+# Environment variables checked by validate_api_keys
+_API_KEY_VARS = frozenset({
+    "TAVILY_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "OPENAI_API_KEY",
+    "GOOGLE_API_KEY",
+    "AGENT_API_KEY",
+})
+
+
+def _present_api_keys() -> FrozenSet[str]:
+    """Return the known API key variables set (non-empty) in the environment."""
+    env = os.environ
+    # Intersect first, then drop keys that are set but empty
+    return frozenset(key for key in env.keys() & _API_KEY_VARS if env[key])
 
 
 def validate_api_keys() -> Tuple[bool, Optional[str]]:
@@ -13,30 +39,32 @@ def validate_api_keys() -> Tuple[bool, Optional[str]]:
     1. TAVILY_API_KEY (always required for search)
     2. At least one valid agent configuration (Anthropic, OpenAI, or Custom)
     
+    The result is cached per set of present keys, so repeated calls only
+    rescan the environment.
+    
     Returns:
         Tuple of (is_valid, error_message)
     """
+    return _validate_api_keys_cached(_present_api_keys())
+
+
+@lru_cache(maxsize=8)
+def _validate_api_keys_cached(present: FrozenSet[str]) -> Tuple[bool, Optional[str]]:
     error_messages = []
     
     # 1. Check Search Key
-    if not os.environ.get("TAVILY_API_KEY"):
+    if "TAVILY_API_KEY" not in present:
          error_messages.append("Missing TAVILY_API_KEY for search functionality.")
 
     # 2. Check Agent Provider Keys
     # We check if *any* valid combination exists or if the specific one selected in settings is valid.
     # Since we don't have access to settings here easily without circular imports, 
     # we'll do a loose check: ensure at least one known key is present.
-    
-    has_anthropic = bool(os.environ.get("ANTHROPIC_API_KEY"))
-    has_openai = bool(os.environ.get("OPENAI_API_KEY"))
-    has_google = bool(os.environ.get("GOOGLE_API_KEY"))
-    has_agent_key = bool(os.environ.get("AGENT_API_KEY"))
-    
     # If using custom provider, base url might be enough, but let's assume we need at least one key
     # or the user knows what they are doing. 
     # To be safe, warn if NO keys are found at all.
     
-    if not (has_anthropic or has_openai or has_google or has_agent_key):
+    if not present - {"TAVILY_API_KEY"}:
         error_messages.append(
             "Missing Agent API config. Please set one of:\n"
             "  - ANTHROPIC_API_KEY\n"
@@ -63,16 +91,24 @@ def validate_path(path: Path, must_exist: bool = False, create: bool = False) ->
         True if valid, False otherwise
     """
     try:
-        path = Path(path)
+        # Plain os/os.path calls: pathlib adds nothing but overhead here
+        p = os.fspath(path)
+        
+        # One stat() answers both questions below
+        try:
+            os.stat(p)
+            exists = True
+        except (FileNotFoundError, NotADirectoryError):
+            exists = False
         
-        if must_exist and not path.exists():
+        if must_exist and not exists:
             return False
         
-        if create and not path.exists():
-            if path.suffix:  # It's a file
-                path.parent.mkdir(parents=True, exist_ok=True)
+        if create and not exists:
+            if os.path.splitext(p)[1]:  # It's a file
+                os.makedirs(os.path.dirname(p) or '.', exist_ok=True)
             else:  # It's a directory
-                path.mkdir(parents=True, exist_ok=True)
+                os.makedirs(p, exist_ok=True)
         
         return True
         
@@ -91,23 +127,38 @@ def validate_query(query: str, min_length: int = 3, max_length: int = 500) -> Tu
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not query or not query.strip():
+    query = query.strip()
+    if not query:
         return False, "Query cannot be empty"
     
-    query = query.strip()
+    length = len(query)
+    if min_length <= length <= max_length:
+        return True, None
     
-    if len(query) < min_length:
+    if length < min_length:
         return False, f"Query too short (minimum {min_length} characters)"
     
-    if len(query) > max_length:
-        return False, f"Query too long (maximum {max_length} characters)"
+    return False, f"Query too long (maximum {max_length} characters)"
+
+
+def contains_cjk(text: str) -> bool:
+    """Check whether text contains any Chinese (CJK) characters.
     
-    return True, None
+    Args:
+        text: Text to check
+        
+    Returns:
+        True if at least one CJK ideograph is present
+    """
+    return _CJK_RE.search(text) is not None
 
 
+@lru_cache(maxsize=256)
 def sanitize_filename(filename: str, max_length: int = 50) -> str:
     """Sanitize a string to be used as a filename.
     
+    Results are memoized, since the same titles and queries recur.
+    
     Args:
         filename: Original filename
         max_length: Maximum filename length
@@ -115,20 +166,23 @@ def sanitize_filename(filename: str, max_length: int = 50) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    
-    # Replace spaces with underscores
-    sanitized = sanitized.replace(' ', '_')
+    # Replace invalid characters and spaces with underscores
+    if filename.isascii():
+        sanitized = filename.encode('ascii').translate(_FILENAME_BYTE_TABLE).decode('ascii')
+    else:
+        sanitized = filename.translate(_FILENAME_TRANSLATE)
     
     # Remove consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+    # (each pass halves the longest run, so this rarely loops more than once)
+    while '__' in sanitized:
+        sanitized = sanitized.replace('__', '_')
     
     # Trim to max length
     if len(sanitized) > max_length:
         sanitized = sanitized[:max_length]
     
-    # Remove leading/trailing underscores
-    sanitized = sanitized.strip('_')
+    # Remove leading/trailing underscores (skipping the copy when there are none)
+    if sanitized[:1] == '_' or sanitized[-1:] == '_':
+        sanitized = sanitized.strip('_')
     
     return sanitized or "unnamed"
@@ -30,19 +30,29 @@ class TestResearchAgent:
         settings.agent_model = "claude-test"
         settings.agent_temperature = 0.7
         settings.agent_max_tokens = 1000
+        settings.agent_debug_dump = False
         
         settings.search_max_results = 5
+        settings.search_cache_enabled = False
+        settings.search_cache_ttl = 60
+        settings.batch_concurrency = 2
         settings.storage_data_dir = "/tmp/research_test"
         settings.export_output_dir = "/tmp/reports_test"
         settings.storage_auto_save = True
+        settings.storage_compress = True
         settings.export_default_format = "markdown"
+        settings.cache_enabled = False
+        settings.cache_dir = "/tmp/research_cache_test"
+        settings.cache_max_entries = 10
+        settings.cache_ttl = 60
+        settings.skills_dir = None
         return settings
     
     @patch('lonai.core.agent.create_deep_agent')
     @patch('lonai.core.agent.SearchTool')
     @patch('lonai.core.agent.StorageManager')
     @patch('lonai.core.agent.ReportExporter')
-    @patch('langchain_anthropic.ChatAnthropic') 
+    @patch('langchain_anthropic.ChatAnthropic')
     def test_agent_initialization(
         self,
         mock_anthropic,
@@ -53,18 +63,45 @@ class TestResearchAgent:
         mock_settings
     ):
         """Test that ResearchAgent initializes correctly."""
-        # Ensure model init returns our mock
-        mock_anthropic.return_value = Mock()
-        
         agent = ResearchAgent(settings=mock_settings)
         
         assert agent is not None
         assert agent.settings == mock_settings
         mock_search.assert_called_once()
-        mock_storage.assert_called_once()
-        mock_exporter.assert_called_once()
         mock_create_agent.assert_called_once()
         mock_anthropic.assert_called_once()
+        
+        # The base prompt is marked for Anthropic prompt caching even without custom instructions
+        system_prompt = mock_create_agent.call_args.kwargs["system_prompt"]
+        assert system_prompt.content[0]["cache_control"] == {"type": "ephemeral"}
+        
+        # Storage and export helpers are created lazily, once
+        mock_storage.assert_not_called()
+        mock_exporter.assert_not_called()
+        assert agent.storage_manager is agent.storage_manager
+        assert agent.report_exporter is agent.report_exporter
+        mock_storage.assert_called_once()
+        mock_exporter.assert_called_once()
+
+    @patch('lonai.core.agent.create_deep_agent')
+    @patch('lonai.core.agent.SearchTool')
+    @patch('lonai.core.agent.StorageManager')
+    @patch('langchain_anthropic.ChatAnthropic')
+    def test_helpers_created_once_across_threads(
+        self, mock_anthropic, mock_storage, mock_search, mock_create_agent, mock_settings
+    ):
+        """Test that concurrent first access builds a single storage manager."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        
+        mock_storage.side_effect = lambda **kwargs: time.sleep(0.01) or Mock()
+        agent = ResearchAgent(settings=mock_settings)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            managers = list(pool.map(lambda _: agent.storage_manager, range(8)))
+        
+        mock_storage.assert_called_once()
+        assert all(manager is managers[0] for manager in managers)
 
     @patch('lonai.core.agent.create_deep_agent')
     @patch('langchain_anthropic.ChatAnthropic')
@@ -78,7 +115,6 @@ class TestResearchAgent:
             ]
         }
         mock_create_agent.return_value = mock_agent_instance
-        mock_anthropic.return_value = Mock()
         
         # Create agent and conduct research
         agent = ResearchAgent(settings=mock_settings)
@@ -106,7 +142,6 @@ class TestResearchAgent:
             "messages": [Mock(content="Test response")]
         }
         mock_create_agent.return_value = mock_agent_instance
-        mock_anthropic.return_value = Mock()
         
         agent = ResearchAgent(settings=mock_settings)
         
@@ -117,14 +152,45 @@ class TestResearchAgent:
             )
         
         assert len(results) == 2
-        assert all("query" in r for r in results)
-        assert all("response" in r for r in results)
+        assert [r["query"] for r in results] == ["Query 1", "Query 2"]
+        assert all({"query", "response"} <= r.keys() for r in results)
 
+    @patch('lonai.core.agent.create_deep_agent')
+    @patch('langchain_anthropic.ChatAnthropic')
+    def test_research_uses_cache(self, mock_anthropic, mock_create_agent, mock_settings, tmp_path):
+        """Test that repeated research is served from the cache."""
+        mock_agent_instance = Mock()
+        mock_agent_instance.invoke.return_value = {
+            "messages": [Mock(content="Cached response")]
+        }
+        mock_create_agent.return_value = mock_agent_instance
+        mock_settings.cache_enabled = True
+        mock_settings.cache_dir = tmp_path
+        
+        agent = ResearchAgent(settings=mock_settings)
+        
+        first = agent.research(query="Test query", save_results=False)
+        second = agent.research(query="  test   QUERY ", save_results=False)
+        refreshed = agent.research(query="Test query", save_results=False, refresh_cache=True)
+        
+        assert mock_agent_instance.invoke.call_count == 2
+        assert "cached" not in first
+        assert second["cached"] is True
+        assert second["response"] == "Cached response"
+        assert "cached" not in refreshed
+        
+        # Different instructions produce different answers, so they don't share entries
+        instructed = ResearchAgent(settings=mock_settings, custom_instructions="Be brief.")
+        assert "cached" not in instructed.research(query="Test query", save_results=False)
+    
     @patch('lonai.core.agent.create_deep_agent')
     @patch('lonai.core.agent.SearchTool')
     @patch('lonai.core.agent.StorageManager')
     @patch('lonai.core.agent.ReportExporter')
-    def test_agent_openai_init(self, mock_exporter, mock_storage, mock_search, mock_create, mock_settings):
+    @patch('langchain_openai.ChatOpenAI')
+    def test_agent_openai_init(
+        self, mock_openai, mock_exporter, mock_storage, mock_search, mock_create, mock_settings
+    ):
         """Test initialization with OpenAI provider."""
         from lonai.config.constants import AgentProvider
         
@@ -135,24 +201,17 @@ class TestResearchAgent:
         mock_settings.agent_base_url = None
         mock_settings.agent_model = "gpt-4"
         
-        # When mocking imports inside the function, we need to patch specifically where it is imported
-        # But since the import happens INSIDE _configure_model based on provider, 
-        # it is safer to patch sys.modules or just patch the import target in the module namespace 
-        # IF it was top-level.
-        # Since it is inside the method, we can use patch with 'lonai.core.agent.ChatOpenAI'
-        # BUT this only works if the runtime actually tries to resolve it.
-        # Let's ensure the previous failure (AttributeError) is fixed by ensuring the import succeeds or is mocked.
-        
-        # NOTE: patch('lonai.core.agent.ChatOpenAI') Failed because ChatOpenAI is not in agent.py namespace
-        # until imported. Since it is dynamic, we should patch where it comes from: 'langchain_openai.ChatOpenAI'
-        # OR force it into the namespace. 
-        
-        with patch('langchain_openai.ChatOpenAI') as MockChatOpenAI:
-             agent = ResearchAgent(settings=mock_settings)
-             MockChatOpenAI.assert_called_once()
-             _, kwargs = MockChatOpenAI.call_args
-             assert kwargs['model'] == "gpt-4"
-             assert kwargs['api_key'] == "sk-test-key"
+        # The model classes are imported inside the provider factories, so
+        # patch 'langchain_openai.ChatOpenAI' where it comes from
+        agent = ResearchAgent(settings=mock_settings)
+        
+        assert agent.settings is mock_settings
+        mock_openai.assert_called_once()
+        _, kwargs = mock_openai.call_args
+        assert kwargs['model'] == "gpt-4"
+        assert kwargs['api_key'] == "sk-test-key"
+        # The OpenAI system prompt is a plain string, without cache markers
+        assert isinstance(mock_create.call_args.kwargs["system_prompt"], str)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""Tests for the research cache."""
+
+import os
+
+import pytest
+from unittest.mock import patch
+
+from lonai.core.cache import ResearchCache
+from lonai.utils import serialization
+
+
+class TestResearchCache:
+    """Tests for ResearchCache."""
+    
+    def test_get_and_set(self, tmp_path):
+        """Test storing and retrieving a cached result."""
+        cache = ResearchCache(cache_dir=tmp_path)
+        key = cache.make_key("What is AI?", "en", "claude-test", 0.7)
+        
+        assert cache.get(key) is None
+        cache.set(key, {"query": "What is AI?", "response": "An answer"})
+        assert cache.get(key)["response"] == "An answer"
+    
+    def test_key_normalization(self):
+        """Test that whitespace and case do not change the key."""
+        make_key = ResearchCache.make_key
+        
+        assert make_key("What is  AI?", "en") == make_key(" what is ai? ", "en")
+        assert make_key("What is AI?", "en") != make_key("What is AI?", "zh")
+    
+    def test_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted."""
+        cache = ResearchCache(cache_dir=tmp_path, max_entries=2)
+        for i, query in enumerate(["one", "two", "three"]):
+            key = cache.make_key(query)
+            cache.set(key, {"response": query})
+            os.utime(tmp_path / f"{key}.json", (i, i))
+        cache._evict()
+        
+        assert cache.get(cache.make_key("one")) is None
+        assert cache.get(cache.make_key("three"))["response"] == "three"
+    
+    def test_ttl(self, tmp_path):
+        """Test that entries older than the TTL are misses."""
+        cache = ResearchCache(cache_dir=tmp_path, ttl=60)
+        key = cache.make_key("What is AI?")
+        cache.set(key, {"response": "An answer"})
+        assert cache.get(key)["response"] == "An answer"
+        
+        (tmp_path / f"{key}.json").write_bytes(
+            serialization.dumps({"cached_at": 0, "response": "Stale"})
+        )
+        assert cache.get(key) is None
+    
+    def test_set_survives_concurrent_eviction(self, tmp_path):
+        """Test that entries vanishing mid-eviction don't make set() raise."""
+        cache = ResearchCache(cache_dir=tmp_path, max_entries=1)
+        cache.set(cache.make_key("one"), {"response": "one"})
+        
+        with patch("pathlib.Path.stat", side_effect=FileNotFoundError):
+            cache.set(cache.make_key("two"), {"response": "two"})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,15 +4,16 @@ import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, Mock
 
-from lonai.cli.commands import cli
+from lonai.cli.commands import _count_queries, _iter_queries, cli
+from lonai.tools.storage import HistoryBatch
 
 
 class TestCLI:
     """Tests for CLI commands."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def runner(self):
-        """Create a CLI test runner."""
+        """Create a CLI test runner (stateless between invokes, so shared)."""
         return CliRunner()
     
     @patch('lonai.cli.commands.validate_api_keys')
@@ -24,7 +25,7 @@ class TestCLI:
         assert "Research Assistant" in result.output
     
     @patch('lonai.cli.commands.validate_api_keys')
-    @patch('lonai.cli.commands.ResearchAgent')
+    @patch('lonai.core.agent.ResearchAgent')
     def test_research_command(self, mock_agent_class, mock_validate, runner):
         """Test research command."""
         mock_validate.return_value = (True, None)
@@ -42,6 +43,76 @@ class TestCLI:
         assert result.exit_code == 0
         mock_agent.research.assert_called_once()
     
+    @patch('lonai.cli.commands.validate_api_keys')
+    @patch('lonai.core.agent.ResearchAgent')
+    def test_research_export_format(self, mock_agent_class, mock_validate, runner):
+        """Test research command passes the export format per call."""
+        from lonai.config.constants import ExportFormat
+        
+        mock_validate.return_value = (True, None)
+        
+        mock_agent = Mock()
+        mock_agent.research.return_value = {"query": "test", "response": "Test response"}
+        mock_agent_class.return_value = mock_agent
+        
+        result = runner.invoke(cli, ['research', 'What is AI?', '--export', '--format', 'html'])
+        
+        assert result.exit_code == 0
+        _, kwargs = mock_agent.research.call_args
+        assert kwargs['export_report'] is True
+        assert kwargs['export_format'] == ExportFormat.HTML
+    
+    @patch('lonai.cli.commands.validate_api_keys')
+    @patch('lonai.core.agent.ResearchAgent')
+    def test_research_detects_chinese(self, mock_agent_class, mock_validate, runner):
+        """Test research command switches to Chinese for CJK queries."""
+        mock_validate.return_value = (True, None)
+        
+        mock_agent = Mock()
+        mock_agent.research.return_value = {"query": "test", "response": "Test response"}
+        mock_agent_class.return_value = mock_agent
+        
+        result = runner.invoke(cli, ['research', '最新的AI发展趋势'])
+        
+        assert result.exit_code == 0
+        mock_agent_class.assert_called_once_with(language="zh")
+    
+    @patch('lonai.cli.commands.validate_api_keys')
+    @patch('lonai.core.agent.ResearchAgent')
+    def test_batch_command(self, mock_agent_class, mock_validate, runner, tmp_path):
+        """Test batch command runs every query and keeps input order."""
+        mock_validate.return_value = (True, None)
+        
+        mock_agent = Mock()
+        mock_agent.research.side_effect = lambda query, **kwargs: {
+            "query": query,
+            "response": "Test response"
+        }
+        mock_agent_class.return_value = mock_agent
+        
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_text("Query one\n\nQuery two\nQuery three\n", encoding="utf-8")
+        
+        result = runner.invoke(cli, ['batch', str(queries_file), '--concurrency', '2'])
+        
+        assert result.exit_code == 0
+        assert mock_agent.research.call_count == 3
+        assert result.output.index("1. Query one") < result.output.index("3. Query three")
+    
+    def test_query_count_matches_iteration(self, tmp_path):
+        """Test that whitespace-only lines (including Unicode spaces) are skipped consistently."""
+        queries_file = tmp_path / "queries.txt"
+        queries_file.write_bytes(
+            "First query\n\u00a0\n  \n\u3000\n\x1f\r\nSecond query\rThird\r\n\u4f60\u597d\n"
+            .encode("utf-8")
+        )
+        
+        queries = list(_iter_queries(str(queries_file)))
+        assert queries == ["First query", "Second query", "Third", "\u4f60\u597d"]
+        # Small blocks exercise lines split across reads
+        for block_size in (1, 2, 7, 1 << 20):
+            assert _count_queries(str(queries_file), block_size) == len(queries)
+    
     @patch('lonai.cli.commands.validate_api_keys')
     def test_config_command(self, mock_validate, runner):
         """Test config command."""
@@ -51,20 +122,19 @@ class TestCLI:
         assert "Configuration" in result.output or result.exit_code == 1
     
     @patch('lonai.cli.commands.validate_api_keys')
-    @patch('lonai.cli.commands.ResearchAgent')
+    @patch('lonai.core.agent.ResearchAgent')
     @patch('lonai.cli.commands.get_settings')
     def test_history_command(self, mock_get_settings, mock_agent_class, mock_validate, runner):
         """Test history command."""
         mock_validate.return_value = (True, None)
         
         mock_agent = Mock()
-        mock_agent.get_history.return_value = [
-            {
-                "filename": "test.json",
-                "query": "Test query",
-                "timestamp": "2026-01-01T00:00:00"
-            }
-        ]
+        mock_agent.get_history.return_value = HistoryBatch(
+            queries=["Test query"],
+            timestamps=["2026-01-01T00:00:00"],
+            filenames=["test.json"],
+            paths=["/tmp/test.json"]
+        )
         mock_agent_class.return_value = mock_agent
         
         result = runner.invoke(cli, ['history'])
@@ -0,0 +1,55 @@
+"""Tests for prompt management."""
+
+import pytest
+
+from lonai.core.prompts import PromptManager
+
+
+class TestPromptManager:
+    """Tests for PromptManager."""
+    
+    def test_research_prompt_language(self):
+        """Test that the prompt matches the configured language."""
+        en = PromptManager(language="en")
+        zh = PromptManager(language="zh")
+        
+        assert en.get_research_prompt() == PromptManager.RESEARCH_PROMPT_EN
+        assert zh.get_research_prompt() == PromptManager.RESEARCH_PROMPT_ZH
+    
+    def test_custom_instructions_cached(self):
+        """Test that custom instructions are appended and the result reused."""
+        manager = PromptManager(language="en")
+        
+        prompt = manager.get_research_prompt("Cite every source.")
+        
+        assert prompt.startswith(PromptManager.RESEARCH_PROMPT_EN)
+        assert prompt.endswith("Cite every source.")
+        assert manager.get_research_prompt("Cite every source.") is prompt
+    
+    def test_custom_prompts_are_per_instance(self):
+        """Test that custom prompts added to one manager do not leak into another."""
+        first = PromptManager(language="en")
+        second = PromptManager(language="en")
+        
+        first.add_custom_prompt("review", "Review the draft.")
+        
+        assert first.get_custom_prompt("review") == "Review the draft."
+        assert second.get_custom_prompt("review") is None
+        assert first.get_research_prompt("x") is second.get_research_prompt("x")
+    
+    def test_research_prompt_blocks(self):
+        """Test that the static base prompt is marked for caching and comes first."""
+        manager = PromptManager(language="en")
+        
+        blocks = manager.get_research_prompt_blocks("Cite every source.")
+        
+        assert len(blocks) == 2
+        assert blocks[0]["text"] == PromptManager.RESEARCH_PROMPT_EN
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in blocks[1]
+        assert blocks[1]["text"].endswith("Cite every source.")
+        assert len(manager.get_research_prompt_blocks()) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
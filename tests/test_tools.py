@@ -1,12 +1,10 @@
 """Tests for tool modules."""
 
 import pytest
-from pathlib import Path
 from unittest.mock import Mock, patch
-import tempfile
 import json
 
-from lonai.tools.search import SearchTool
+from lonai.tools.search import SearchTool, _get_client
 from lonai.tools.storage import StorageManager
 from lonai.tools.export import ReportExporter
 from lonai.config.constants import ExportFormat
@@ -15,6 +13,13 @@ from lonai.config.constants import ExportFormat
 class TestSearchTool:
     """Tests for SearchTool."""
     
+    @pytest.fixture(autouse=True)
+    def reset_shared_clients(self):
+        """Don't reuse Tavily clients created under another test's patch."""
+        _get_client.cache_clear()
+        yield
+        _get_client.cache_clear()
+    
     @patch('lonai.tools.search.TavilyClient')
     def test_search_initialization(self, mock_tavily):
         """Test SearchTool initialization."""
@@ -23,6 +28,10 @@ class TestSearchTool:
         assert tool is not None
         assert tool.max_results == 5
         mock_tavily.assert_called_once_with(api_key="test-key")
+        
+        # Tools with the same key share one client (and its connection pool)
+        assert SearchTool(api_key="test-key").client is tool.client
+        mock_tavily.assert_called_once()
     
     @patch('lonai.tools.search.TavilyClient')
     def test_search_execution(self, mock_tavily):
@@ -59,122 +68,279 @@ class TestSearchTool:
         assert mock_client.search.call_count == 1
         assert result1 == result2
 
+    @patch('lonai.tools.search.TavilyClient')
+    def test_search_cache_normalization_and_eviction(self, mock_tavily):
+        """Test that cache keys are normalized and the cache is bounded."""
+        mock_client = Mock()
+        mock_client.search.return_value = {"query": "test", "results": []}
+        mock_tavily.return_value = mock_client
+
+        tool = SearchTool(api_key="test-key", cache_size=2)
+
+        tool.search("Test  Query")
+        tool.search(" test query ")
+        assert mock_client.search.call_count == 1
+
+        tool.search("second")
+        tool.search("third")  # evicts "test query"
+        assert len(tool._cache) == 2
+        tool.search("test query")
+        assert mock_client.search.call_count == 4
+
+    @patch('lonai.tools.search.TavilyClient')
+    def test_search_disk_cache(self, mock_tavily, tmp_path):
+        """Test that search results persist across SearchTool instances."""
+        mock_client = Mock()
+        mock_client.search.return_value = {"query": "test", "results": []}
+        mock_tavily.return_value = mock_client
+
+        SearchTool(api_key="test-key", cache_path=tmp_path).search("test")
+        result = SearchTool(api_key="test-key", cache_path=tmp_path).search("test")
+        assert result == {"query": "test", "results": []}
+        assert mock_client.search.call_count == 1
+
+        # Expired entries are fetched again
+        SearchTool(api_key="test-key", cache_path=tmp_path, cache_ttl=0.0001).search("test")
+        assert mock_client.search.call_count == 2
+
+    @patch('lonai.tools.search.AsyncTavilyClient')
+    @patch('lonai.tools.search.TavilyClient')
+    def test_asearch_many(self, mock_tavily, mock_async_tavily):
+        """Test concurrent searches share the cache and keep order."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_async_client = Mock()
+        mock_async_client.search = AsyncMock(
+            side_effect=lambda query, **kwargs: {"query": query, "results": []}
+        )
+        mock_async_tavily.return_value = mock_async_client
+
+        tool = SearchTool(api_key="test-key")
+        results = asyncio.run(tool.asearch_many([{"query": "one"}, {"query": "two"}]))
+
+        assert [r["query"] for r in results] == ["one", "two"]
+        assert tool.search("one") == {"query": "one", "results": []}
+        mock_tavily.return_value.search.assert_not_called()
+        mock_async_tavily.assert_called_once_with(api_key="test-key")
+        
+        # A bad spec becomes an error result instead of sinking the batch
+        results = asyncio.run(tool.asearch_many([{"query": "bad", "bogus": 1}, {"query": "three"}]))
+        assert results[0]["query"] == "bad" and "error" in results[0]
+        assert results[1] == {"query": "three", "results": []}
+
 
 class TestStorageManager:
     """Tests for StorageManager."""
     
-    def test_storage_initialization(self):
+    @pytest.fixture(scope="module")
+    def shared_dir(self, tmp_path_factory):
+        """Data directory shared by tests that don't rely on it being empty."""
+        return tmp_path_factory.mktemp("storage")
+    
+    @pytest.fixture(scope="module")
+    def shared_manager(self, shared_dir):
+        """StorageManager shared by tests that don't rely on an empty directory."""
+        return StorageManager(data_dir=shared_dir)
+    
+    def test_storage_initialization(self, shared_manager, shared_dir):
         """Test StorageManager initialization."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = StorageManager(data_dir=tmpdir)
-            assert manager is not None
-            assert manager.data_dir == Path(tmpdir)
+        assert shared_manager is not None
+        assert shared_manager.data_dir == shared_dir
     
-    def test_save_and_load_research(self):
+    def test_save_and_load_research(self, shared_manager):
         """Test saving and loading research data."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = StorageManager(data_dir=tmpdir)
-            
-            # Save research
-            filepath = manager.save_research(
-                query="Test query",
-                results="Test results",
-                metadata={"test": "data"}
-            )
-            
-            assert filepath.exists()
-            
-            # Load research
-            data = manager.load_research(filepath.name)
-            
-            assert data is not None
-            assert data["query"] == "Test query"
-            assert data["results"] == "Test results"
-            assert data["metadata"]["test"] == "data"
-    
-    def test_list_research(self):
+        manager = shared_manager
+        
+        # Save research
+        filepath = manager.save_research(
+            query="Test query",
+            results="Test results",
+            metadata={"test": "data"}
+        )
+        
+        assert filepath.exists()
+        
+        # Load research
+        data = manager.load_research(filepath.name)
+        
+        assert data is not None
+        assert data["query"] == "Test query"
+        assert data["results"] == "Test results"
+        assert data["metadata"]["test"] == "data"
+    
+    def test_compressed_storage(self, tmp_path):
+        """Test gzip-compressed saves alongside plain JSON files."""
+        plain_manager = StorageManager(data_dir=tmp_path, compress=False)
+        plain = plain_manager.save_research("Plain", "Results 1")
+        manager = StorageManager(data_dir=tmp_path)
+        
+        filepath = manager.save_research("Compressed", "Results 2")
+        
+        assert plain.suffix == ".json"
+        assert filepath.name.endswith(".json.gz")
+        assert manager.load_research(filepath.name)["results"] == "Results 2"
+        assert manager.load_research(plain.name)["results"] == "Results 1"
+        
+        manager.index_path.unlink()
+        assert sorted(manager.list_history().queries) == ["Compressed", "Plain"]
+    
+    def test_async_save_research(self, tmp_path):
+        """Test saving research from async code."""
+        import asyncio
+        
+        manager = StorageManager(data_dir=tmp_path)
+        
+        filepath = asyncio.run(manager.asave_research("Async query", "Async results"))
+        
+        assert filepath.exists()
+        assert manager.load_research(filepath.name)["results"] == "Async results"
+    
+    def test_list_research(self, shared_manager):
         """Test listing research files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manager = StorageManager(data_dir=tmpdir)
-            
-            # Save multiple research files
-            manager.save_research("Query 1", "Results 1")
-            manager.save_research("Query 2", "Results 2")
-            
-            # List research
-            research_list = manager.list_research()
-            
-            assert len(research_list) >= 2
-            assert all("filename" in r for r in research_list)
-            assert all("query" in r for r in research_list)
+        manager = shared_manager
+        
+        # Save multiple research files
+        manager.save_research("Query 1", "Results 1")
+        manager.save_research("Query 2", "Results 2")
+        
+        # List research
+        research_list = manager.list_research()
+        
+        assert len(research_list) >= 2
+        assert all({"filename", "query"} <= r.keys() for r in research_list)
+    
+    def test_search_history(self, tmp_path):
+        """Test keyword search over history columns."""
+        manager = StorageManager(data_dir=tmp_path)
+        
+        manager.save_research("Quantum computing basics", "Results 1")
+        manager.save_research("Climate change", "Results 2")
+        
+        history = manager.search_history("QUANTUM")
+        
+        assert len(history) == 1
+        assert history.queries == ["Quantum computing basics"]
+        assert manager.search_research("quantum")[0]["query"] == "Quantum computing basics"
+        assert manager.search_history("um comp").queries == ["Quantum computing basics"]
+        assert len(manager.search_history("zz")) == 0
+        
+        # The cached index picks up newly saved research
+        manager.save_research("Quantum sensing", "Results 3")
+        assert len(manager.search_history("quantum")) == 2
+    
+    def test_history_index(self, tmp_path):
+        """Test that history is served from the index and kept in sync."""
+        manager = StorageManager(data_dir=tmp_path)
+        
+        first = manager.save_research("First", "Results 1")
+        second = manager.save_research("Second", "Results 2")
+        assert manager.index_path.exists()
+        
+        history = manager.list_history()
+        assert history.queries == ["Second", "First"]
+        assert manager.list_history(limit=1).filenames == [second.name]
+        
+        # Missing index is rebuilt from the research files
+        manager.index_path.unlink()
+        assert len(manager.list_history()) == 2
+        
+        assert manager.delete_research(first.name)
+        assert manager.list_history().filenames == [second.name]
+
+    def test_concurrent_saves_keep_index_complete(self, tmp_path):
+        """Test that concurrent first saves don't lose index entries."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        managers = [StorageManager(data_dir=tmp_path) for _ in range(2)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda i: managers[i % 2].save_research(f"Query {i}", "Results"),
+                range(16)
+            ))
+        
+        assert sorted(managers[0].list_history().queries) == sorted(f"Query {i}" for i in range(16))
+        assert not list(tmp_path.glob("*.tmp"))
 
 
 class TestReportExporter:
     """Tests for ReportExporter."""
     
-    def test_exporter_initialization(self):
+    @pytest.fixture(scope="module")
+    def output_dir(self, tmp_path_factory):
+        """Output directory shared by the export tests."""
+        return tmp_path_factory.mktemp("reports")
+    
+    @pytest.fixture(scope="module")
+    def exporter(self, output_dir):
+        """ReportExporter shared by the export tests."""
+        return ReportExporter(output_dir=output_dir)
+    
+    def test_exporter_initialization(self, exporter, output_dir):
         """Test ReportExporter initialization."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            exporter = ReportExporter(output_dir=tmpdir)
-            assert exporter is not None
-            assert exporter.output_dir == Path(tmpdir)
+        assert exporter is not None
+        assert exporter.output_dir == output_dir
     
-    def test_markdown_export(self):
+    def test_markdown_export(self, exporter):
         """Test Markdown export."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            exporter = ReportExporter(output_dir=tmpdir)
-            
-            filepath = exporter.export(
-                content="# Test Report\n\nThis is a test.",
-                title="Test",
-                format=ExportFormat.MARKDOWN
-            )
-            
-            assert filepath.exists()
-            assert filepath.suffix == ".md"
-            
-            content = filepath.read_text(encoding='utf-8')
-            assert "Test Report" in content
-    
-    def test_html_export(self):
+        filepath = exporter.export(
+            content="# Test Report\n\nThis is a test.",
+            title="Test",
+            format=ExportFormat.MARKDOWN
+        )
+        
+        assert filepath.exists()
+        assert filepath.suffix == ".md"
+        
+        content = filepath.read_text(encoding='utf-8')
+        assert "Test Report" in content
+    
+    def test_html_export(self, exporter):
         """Test HTML export."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            exporter = ReportExporter(output_dir=tmpdir)
-            
-            filepath = exporter.export(
-                content="Test content",
-                title="Test HTML",
-                format=ExportFormat.HTML
-            )
-            
-            assert filepath.exists()
-            assert filepath.suffix == ".html"
-            
-            content = filepath.read_text(encoding='utf-8')
-            assert "<!DOCTYPE html>" in content
-            assert "Test HTML" in content
-    
-    def test_json_export(self):
+        filepath = exporter.export(
+            content="Test content",
+            title="Test HTML",
+            format=ExportFormat.HTML
+        )
+        
+        assert filepath.exists()
+        assert filepath.suffix == ".html"
+        
+        content = filepath.read_text(encoding='utf-8')
+        assert "<!DOCTYPE html>" in content
+        assert "Test HTML" in content
+    
+    def test_markdown_to_html(self, exporter):
+        """Test basic markdown conversion used by the HTML exporter."""
+        html = exporter._simple_markdown_to_html(
+            "## Findings\n\n- **A** and **B**\nPlain text"
+        )
+        
+        assert html.splitlines() == [
+            "<h2>Findings</h2>",
+            "",
+            "<li><strong>A</strong> and <strong>B</strong></li>",
+            "<p>Plain text</p>",
+        ]
+    
+    def test_json_export(self, exporter):
         """Test JSON export."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            exporter = ReportExporter(output_dir=tmpdir)
-            
-            filepath = exporter.export(
-                content="Test content",
-                title="Test JSON",
-                format=ExportFormat.JSON,
-                metadata={"key": "value"}
-            )
-            
-            assert filepath.exists()
-            assert filepath.suffix == ".json"
-            
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            assert data["title"] == "Test JSON"
-            assert data["content"] == "Test content"
-            assert data["metadata"]["key"] == "value"
+        filepath = exporter.export(
+            content="Test content",
+            title="Test JSON",
+            format=ExportFormat.JSON,
+            metadata={"key": "value"}
+        )
+        
+        assert filepath.exists()
+        assert filepath.suffix == ".json"
+        
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+        
+        assert data["title"] == "Test JSON"
+        assert data["content"] == "Test content"
+        assert data["metadata"]["key"] == "value"
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+"""Tests for validation helpers."""
+
+import pytest
+
+from lonai.utils.validators import sanitize_filename, validate_path, validate_query
+
+
+class TestSanitizeFilename:
+    """Tests for sanitize_filename."""
+
+    @pytest.mark.parametrize("filename, max_length, expected", [
+        ("report", 50, "report"),
+        ("What is AI?", 50, "What_is_AI"),
+        ("__leading and trailing__", 50, "leading_and_trailing"),
+        ('a<>:"/\\|?*b', 50, "a_b"),
+        ("a  ??  b", 50, "a_b"),
+        ("你好 世界?", 50, "你好_世界"),
+        ("café: résumé", 50, "café_résumé"),
+        ("abc def", 4, "abc"),
+        ("abc def", 3, "abc"),
+        ("", 50, "unnamed"),
+        ("???", 50, "unnamed"),
+        ("_", 50, "unnamed"),
+    ])
+    def test_sanitize_filename(self, filename, max_length, expected):
+        """Test character replacement, collapsing, truncation and trimming."""
+        assert sanitize_filename(filename, max_length) == expected
+
+    def test_repeated_calls_match(self):
+        """Test that memoized results are the same as fresh ones."""
+        assert sanitize_filename("What is AI?") == sanitize_filename("What is AI?") == "What_is_AI"
+
+
+class TestValidateQuery:
+    """Tests for validate_query."""
+
+    @pytest.mark.parametrize("query, valid, error", [
+        ("", False, "Query cannot be empty"),
+        ("   ", False, "Query cannot be empty"),
+        ("ab", False, "Query too short (minimum 3 characters)"),
+        ("  ab  ", False, "Query too short (minimum 3 characters)"),
+        ("abc", True, None),
+        ("x" * 500, True, None),
+        ("x" * 501, False, "Query too long (maximum 500 characters)"),
+        # Padding is stripped before the length check
+        (" " * 1000 + "abc", True, None),
+        (" " * 2001 + "abc", True, None),
+        ("x" * 3000, False, "Query too long (maximum 500 characters)"),
+    ])
+    def test_validate_query(self, query, valid, error):
+        """Test emptiness and length bounds."""
+        assert validate_query(query) == (valid, error)
+
+
+class TestValidatePath:
+    """Tests for validate_path."""
+
+    def test_must_exist(self, tmp_path):
+        """Test existence checks for str and Path inputs."""
+        assert validate_path(tmp_path, must_exist=True)
+        assert validate_path(str(tmp_path), must_exist=True)
+        assert not validate_path(tmp_path / "missing", must_exist=True)
+
+    def test_create(self, tmp_path):
+        """Test that directories are created, and parents for file paths."""
+        assert validate_path(tmp_path / "a" / "b", create=True)
+        assert (tmp_path / "a" / "b").is_dir()
+
+        assert validate_path(str(tmp_path / "c" / "report.md"), create=True)
+        assert (tmp_path / "c").is_dir()
+        assert not (tmp_path / "c" / "report.md").exists()
+
+    def test_path_under_file(self, tmp_path):
+        """Test a path whose parent is a regular file."""
+        (tmp_path / "file").write_text("x")
+
+        assert validate_path(tmp_path / "file" / "child")
+        assert not validate_path(tmp_path / "file" / "child", must_exist=True)
+        assert not validate_path(tmp_path / "file" / "child", create=True)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])